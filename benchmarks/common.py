@@ -0,0 +1,47 @@
+"""Shared helpers for the benchmarks.
+
+The API package is loaded straight from its directory so the benchmarks
+run without Home Assistant installed. Adding `custom_components/eero` to
+`sys.path` instead would shadow standard library modules such as
+`select` and `time` with the integration's platform modules. The platform
+modules themselves are imported as `custom_components.eero.*` from the
+repository root, and only when Home Assistant is installed.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+from types import ModuleType
+
+API_NAME = "eero_api"
+ROOT = Path(__file__).parents[1]
+API_PATH = ROOT / "custom_components" / "eero" / "api"
+
+
+def load_api() -> ModuleType:
+    """Load the eero API package as a standalone module."""
+    if API_NAME in sys.modules:
+        return sys.modules[API_NAME]
+    spec = importlib.util.spec_from_file_location(
+        API_NAME,
+        API_PATH / "__init__.py",
+        submodule_search_locations=[str(API_PATH)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[API_NAME] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_integration(names: list[str]) -> dict[str, ModuleType] | None:
+    """Import integration modules, or None without Home Assistant."""
+    if importlib.util.find_spec("homeassistant") is None:
+        return None
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    return {
+        name: importlib.import_module(f"custom_components.eero.{name}")
+        for name in names
+    }
@@ -0,0 +1,89 @@
+"""Benchmark JSON decoding of eero API responses.
+
+Compares the previous text based decode (`json.loads(response.text)`), the
+standard library decoding bytes directly, and the orjson backend used by
+`api.util.json_loads` when it is installed.
+
+Usage: python benchmarks/json_decode.py [--clients 500] [--repeat 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import timeit
+
+from common import API_NAME, load_api
+
+
+def generate_devices(clients: int) -> bytes:
+    """Generate a devices response with the given number of clients."""
+    return json.dumps(
+        {
+            "meta": {"code": 200, "server_time": "2024-01-01T00:00:00.000Z"},
+            "data": [
+                {
+                    "url": f"/2.2/networks/1/devices/{index:012x}",
+                    "mac": ":".join(
+                        f"{index:012x}"[i : i + 2] for i in range(0, 12, 2)
+                    ),
+                    "hostname": f"client-{index}",
+                    "nickname": None,
+                    "manufacturer": "Example Inc.",
+                    "ip": f"192.168.{index // 250}.{index % 250 + 2}",
+                    "ips": [f"192.168.{index // 250}.{index % 250 + 2}"],
+                    "connected": index % 3 != 0,
+                    "wireless": index % 4 != 0,
+                    "connection_type": "wireless" if index % 4 else "wired",
+                    "is_guest": index % 10 == 0,
+                    "paused": False,
+                    "channel": 36,
+                    "device_type": "phone",
+                    "last_active": "2024-01-01T00:00:00.000Z",
+                    "source": {"location": "Office", "url": "/2.2/eeros/1"},
+                    "connectivity": {
+                        "signal": "-52 dBm",
+                        "rx_rate_info": {
+                            "channel_width": "80MHz",
+                            "rate_bps": 866700000,
+                        },
+                        "tx_rate_info": {
+                            "channel_width": "80MHz",
+                            "rate_bps": 866700000,
+                        },
+                    },
+                    "interface": {"frequency": "5", "frequency_unit": "GHz"},
+                    "usage": {"down_mbps": 1.25, "up_mbps": 0.5},
+                }
+                for index in range(clients)
+            ],
+        }
+    ).encode()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    load_api()
+    util = importlib.import_module(f"{API_NAME}.util")
+    content = generate_devices(args.clients)
+    decoders = {
+        "json (text)": lambda: json.loads(content.decode()),
+        "json (bytes)": lambda: json.loads(content),
+    }
+    if util.orjson is not None:
+        decoders["orjson (bytes)"] = lambda: util.orjson.loads(content)
+
+    print(f"{args.clients} clients, {len(content) / 1024:.1f} KiB payload")
+    for name, decoder in decoders.items():
+        seconds = min(timeit.repeat(decoder, number=args.repeat, repeat=5))
+        print(f"{name:>16}: {seconds / args.repeat * 1000:.3f} ms per decode")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,540 @@
+"""Stand-in eero cloud for benchmarks.
+
+Serves synthetic accounts over the endpoints `EeroAPI` uses: account,
+network, devices, profiles, thread, backup access points, insights, data
+usage, release notes and the write endpoints. Writes are applied to the
+in-memory resources, so a poll after a write sees the change. Point
+`EeroAPI(api_endpoint=...)` at the server to use it.
+
+Usage: python benchmarks/mock_server.py [--networks 1] [--eeros 3]
+    [--profiles 3] [--clients 50] [--port 8765] [--latency 0.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import UTC, datetime, timedelta
+import random
+from typing import Any
+
+from aiohttp import web
+
+DEVICE_TYPES = [
+    "amazon_echo",
+    "apple_tv",
+    "computer",
+    "game_console",
+    "ipad",
+    "iphone",
+    "light_bulb",
+    "phone",
+    "printer",
+    "smart_plug",
+    "tablet",
+    "tv",
+]
+EERO_MODELS = [
+    ("eero 6+", "S010001"),
+    ("eero Pro 6E", "N010001"),
+    ("eero Pro 6", "K010001"),
+]
+LOCATIONS = [
+    "Basement",
+    "Bedroom",
+    "Den",
+    "Dining Room",
+    "Garage",
+    "Kitchen",
+    "Living Room",
+    "Office",
+]
+OS_VERSION = "v7.2.1-12"
+SERVER_TIME = "2024-01-01T00:00:00.000Z"
+
+
+def mac_address(prefix: int, index: int) -> str:
+    """Generate a MAC address."""
+    value = f"{prefix:04x}{index:08x}"
+    return ":".join(value[i : i + 2] for i in range(0, 12, 2))
+
+
+def generate_client(
+    network_url: str, eeros: list[dict[str, Any]], index: int, rng: random.Random
+) -> dict[str, Any]:
+    """Generate a client."""
+    mac = mac_address(0x0200, index)
+    connected = rng.random() < 0.7
+    wireless = rng.random() < 0.8
+    eero = eeros[index % len(eeros)]
+    return {
+        "url": f"{network_url}/devices/{mac.replace(':', '')}",
+        "mac": mac,
+        "hostname": f"client-{index}",
+        "nickname": f"Client {index}" if index % 5 == 0 else None,
+        "manufacturer": "Example Inc.",
+        "ip": f"192.168.{4 + index // 250}.{index % 250 + 2}",
+        "connected": connected,
+        "wireless": wireless,
+        "connection_type": "wireless" if wireless else "wired",
+        "is_guest": rng.random() < 0.1,
+        "is_private": rng.random() < 0.2,
+        "paused": False,
+        "secondary_wan_deny_access": False,
+        "device_type": rng.choice(DEVICE_TYPES),
+        "channel": rng.choice([1, 6, 11, 36, 149]) if wireless else None,
+        "last_active": (
+            datetime(2024, 1, 1, tzinfo=UTC) - timedelta(minutes=index)
+        ).isoformat(),
+        "interface": {"frequency": "5", "frequency_unit": "GHz"} if wireless else {},
+        "connectivity": {
+            "signal": f"{-rng.randint(35, 80)} dBm",
+            "rx_rate_info": {"channel_width": "80MHz"},
+            "tx_rate_info": {"channel_width": "80MHz"},
+        }
+        if wireless
+        else {},
+        "source": {"location": eero["location"], "url": eero["url"]},
+        "usage": {
+            "down_mbps": round(rng.random() * 50, 2),
+            "up_mbps": round(rng.random() * 10, 2),
+        }
+        if connected
+        else None,
+    }
+
+
+def generate_eero(network_id: int, index: int) -> dict[str, Any]:
+    """Generate an eero."""
+    eero_id = network_id * 1000 + index
+    model, serial = EERO_MODELS[index % len(EERO_MODELS)]
+    url = f"/2.2/eeros/{eero_id}"
+    return {
+        "url": url,
+        "serial": f"{serial}{eero_id:06d}",
+        "location": LOCATIONS[index % len(LOCATIONS)]
+        if index < len(LOCATIONS)
+        else f"Room {index}",
+        "gateway": index == 0,
+        "model": model,
+        "model_number": serial[:4],
+        "mac_address": mac_address(0x0100, eero_id),
+        "status": "green",
+        "os_version": OS_VERSION,
+        "update_available": False,
+        "update_status": {"support_expired": False},
+        "led_on": True,
+        "led_brightness": 100,
+        "connected_clients_count": 0,
+        "resources": {
+            "led_action": f"{url}/led",
+            "reboot": f"{url}/reboot",
+        },
+    }
+
+
+def generate_profile(
+    network_url: str, clients: list[dict[str, Any]], index: int
+) -> dict[str, Any]:
+    """Generate a profile."""
+    return {
+        "url": f"{network_url}/profiles/{index + 1}",
+        "name": f"Profile {index + 1}",
+        "paused": False,
+        "devices": clients,
+        "premium_dns": {"dns_policies": {}},
+        "unified_content_filters": {"dns_policies": {}},
+    }
+
+
+def generate_network(
+    base_url: str,
+    network_id: int,
+    eeros: int,
+    profiles: int,
+    clients: int,
+    rng: random.Random,
+) -> dict[str, Any]:
+    """Generate a network with its resources."""
+    url = f"/2.2/networks/{network_id}"
+    eero_data = [generate_eero(network_id, index) for index in range(eeros)]
+    client_data = [
+        generate_client(url, eero_data, index, rng) for index in range(clients)
+    ]
+    for eero in eero_data:
+        eero["connected_clients_count"] = sum(
+            1
+            for client in client_data
+            if client["connected"] and client["source"]["url"] == eero["url"]
+        )
+    profile_data = [
+        generate_profile(url, client_data[index::profiles], index)
+        for index in range(profiles)
+    ]
+    for profile in profile_data:
+        for client in profile["devices"]:
+            client["profile"] = {"url": profile["url"], "name": profile["name"]}
+    return {
+        "url": url,
+        "name": f"Network {network_id}",
+        "nickname_label": None,
+        "password": "password",
+        "status": "connected",
+        "gateway_ip": "192.168.4.1",
+        "band_steering": True,
+        "backup_internet_enabled": False,
+        "ipv6_upstream": True,
+        "sqm": False,
+        "upnp": True,
+        "wpa3": False,
+        "premium_status": "active",
+        "capabilities": {
+            "backup_access_point": {"capable": True, "requirements": {}},
+            "premium": {"capable": True},
+        },
+        "clients": {"count": clients},
+        "ddns": {"enabled": False, "subdomain": None},
+        "dns": {"caching": True},
+        "geo_ip": {"city": "Springfield", "countryCode": "US", "isp": "Example ISP"},
+        "guest_network": {"enabled": False, "name": "Guest", "password": "guest"},
+        "health": {
+            "eero_network": {"status": "connected"},
+            "internet": {"isp_up": True, "status": "connected"},
+        },
+        "ip_settings": {"public_ip": "203.0.113.1"},
+        "lease": {"dhcp": {"mask": "255.255.252.0", "router": "192.168.4.1"}},
+        "premium_dns": {
+            "ad_block_settings": {"enabled": False, "profiles": []},
+            "dns_policies": {"block_malware": False},
+        },
+        "speed": {
+            "date": SERVER_TIME,
+            "down": {"units": "Mbps", "value": 940.0},
+            "up": {"units": "Mbps", "value": 35.0},
+        },
+        "temporary_flags": {},
+        "timezone": {"value": "America/New_York"},
+        "updates": {
+            "manifest_resource": f"{base_url}/manifest",
+            "preferred_update_hour": 3,
+        },
+        "eeros": {"count": eeros, "data": eero_data},
+        "resources": {
+            "devices": f"{url}/devices",
+            "insights": f"{url}/insights",
+            "profiles": f"{url}/profiles",
+            "reboot": f"{url}/reboot",
+            "settings": f"{url}/settings",
+            "thread": f"{url}/thread",
+            "updates": f"{url}/updates",
+        },
+        "thread": {"enabled": True, "name": f"Network {network_id} Thread"},
+        "backup_access_points": [
+            {
+                "uuid": f"{network_id:08d}-0000-0000-0000-000000000001",
+                "ssid": "Backup",
+                "password": "backup",
+                "enabled": False,
+                "connectivity": {},
+                "created": SERVER_TIME,
+                "last_updated_at": SERVER_TIME,
+            }
+        ],
+        "devices": client_data,
+        "profiles": profile_data,
+    }
+
+
+def generate_series(body: dict[str, Any], rng: random.Random) -> list[dict[str, Any]]:
+    """Generate time series values for an activity request body."""
+    start = datetime.fromisoformat(body["start"])
+    end = datetime.fromisoformat(body["end"])
+    step = timedelta(hours=1) if body.get("cadence") == "hourly" else timedelta(days=1)
+    values = []
+    while start <= end:
+        values.append(
+            {
+                "time": start.isoformat().replace("+00:00", "Z"),
+                "value": rng.randint(0, 1000),
+            }
+        )
+        start += step
+    return values
+
+
+class MockEeroCloud:
+    """Synthetic eero cloud served with aiohttp."""
+
+    def __init__(
+        self,
+        networks: int = 1,
+        eeros: int = 3,
+        profiles: int = 3,
+        clients: int = 50,
+        latency: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        seed: int = 0,
+    ) -> None:
+        """Initialize."""
+        self.host = host
+        self.latency = latency
+        self.port = port
+        self.rng = random.Random(seed)
+        self.requests: list[tuple[str, str]] = []
+        self.writes: list[tuple[str, str, Any]] = []
+        self.networks = {
+            f"/2.2/networks/{network_id}": generate_network(
+                self.url, network_id, eeros, profiles, clients, self.rng
+            )
+            for network_id in range(1, networks + 1)
+        }
+        self.resources: dict[str, dict[str, Any]] = {}
+        for network_url, network in self.networks.items():
+            self.resources[network_url] = network
+            for key in ["devices", "profiles"]:
+                for resource in network[key]:
+                    self.resources[resource["url"]] = resource
+            for client in network["devices"]:
+                self.resources[f"{network_url}/devices/{client['mac']}"] = client
+            for eero in network["eeros"]["data"]:
+                self.resources[eero["url"]] = eero
+            for backup_network in network["backup_access_points"]:
+                url = f"{network_url}/backup_access_points/{backup_network['uuid']}"
+                self.resources[url] = backup_network
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL, to pass to `EeroAPI` as `api_endpoint`."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def account(self) -> dict[str, Any]:
+        """Account."""
+        return {
+            "name": "Benchmark",
+            "log_id": "benchmark",
+            "premium_status": "active",
+            "email": {"value": "benchmark@example.com", "verified": True},
+            "phone": {"value": "+15555550100", "verified": True},
+            "networks": {
+                "count": len(self.networks),
+                "data": [
+                    {"url": url, "name": network["name"]}
+                    for url, network in self.networks.items()
+                ],
+            },
+        }
+
+    def create_app(self) -> web.Application:
+        """Create the aiohttp application."""
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", self.handle)
+        return app
+
+    async def async_start(self) -> None:
+        """Start serving."""
+        self._runner = web.AppRunner(self.create_app())
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> MockEeroCloud:
+        """Async enter."""
+        await self.async_start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Async exit."""
+        await self.async_stop()
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Handle a request."""
+        self.requests.append((request.method, request.path))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        body = None
+        if request.can_read_body:
+            body = await request.json()
+        path = request.path.replace("/2.3/", "/2.2/", 1)
+        if path == "/manifest":
+            return web.json_response(
+                {
+                    "target": {"os_version": OS_VERSION, "title": "eero OS"},
+                    "history": [{"os_version": OS_VERSION, "title": "eero OS"}],
+                }
+            )
+        if path.startswith("/2.2/login"):
+            return self.respond({"user_token": "benchmark"})
+        if request.method == "GET":
+            data = self.get(path, body or {})
+        else:
+            data = self.write(request.method, path, body or {})
+        if data is None:
+            return web.json_response(
+                {"meta": {"code": 404, "error": "error.not_found"}}, status=404
+            )
+        return self.respond(data)
+
+    def respond(self, data: Any) -> web.Response:
+        """Wrap data in the cloud response envelope."""
+        return web.json_response(
+            {"meta": {"code": 200, "server_time": SERVER_TIME}, "data": data}
+        )
+
+    def get(self, path: str, body: dict[str, Any]) -> Any:
+        """Read endpoints."""
+        if path == "/2.2/account":
+            return self.account
+        if path in self.networks:
+            network = self.networks[path]
+            return {
+                key: value
+                for key, value in network.items()
+                if key not in ["backup_access_points", "devices", "profiles", "thread"]
+            }
+        network_url, resource = self.split(path)
+        if (network := self.networks.get(network_url)) is None:
+            return None
+        if resource in ["backup_access_points", "devices", "profiles", "thread"]:
+            return network[resource]
+        if resource.startswith("insights"):
+            return self.insights(network, resource, body)
+        if resource.startswith("data_usage"):
+            return self.data_usage(network, resource, body)
+        return None
+
+    @staticmethod
+    def split(path: str) -> tuple[str, str]:
+        """Split a path into its network URL and the resource below it."""
+        parts = path.split("/", 4)
+        return ("/".join(parts[:4]), parts[4] if len(parts) > 4 else "")
+
+    def insights(
+        self, network: dict[str, Any], resource: str, body: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Insights."""
+        insight_type = body.get("insight_type", "blocked")
+        insights_url = network["resources"]["insights"]
+        values = generate_series(body, self.rng)
+        total = {
+            "insight_type": insight_type,
+            "sum": sum(value["value"] for value in values),
+            "values": values,
+        }
+        if resource.startswith("insights/profiles/"):
+            return {
+                "insights": [
+                    {**total, "insights_url": f"{insights_url}/{resource[9:]}"}
+                ]
+            }
+        devices = [
+            {
+                "insight_type": insight_type,
+                "insights_url": f"{insights_url}/devices/{client['url'].rsplit('/', 1)[1]}",
+                "sum": self.rng.randint(0, 100),
+                "values": [],
+            }
+            for client in network["devices"]
+        ]
+        if resource == "insights/devices":
+            return {"insights": devices}
+        return {"insights": [total, *devices]}
+
+    def data_usage(
+        self, network: dict[str, Any], resource: str, body: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Data usage."""
+        if resource in ["data_usage/devices", "data_usage/eeros"]:
+            resources = (
+                network["devices"]
+                if resource == "data_usage/devices"
+                else network["eeros"]["data"]
+            )
+            return {
+                "values": [
+                    {
+                        "url": item["url"],
+                        "download": self.rng.randint(0, 10**9),
+                        "upload": self.rng.randint(0, 10**8),
+                    }
+                    for item in resources
+                ]
+            }
+        series = []
+        for series_type in ["download", "upload"]:
+            values = generate_series(body, self.rng)
+            series.append(
+                {
+                    "type": series_type,
+                    "sum": sum(value["value"] for value in values),
+                    "values": values,
+                }
+            )
+        return {"series": series}
+
+    def write(self, method: str, path: str, body: dict[str, Any]) -> Any:
+        """Write endpoints."""
+        self.writes.append((method, path, body))
+        if path in self.resources:
+            self.resources[path].update(body)
+            return self.resources[path]
+        base, _, action = path.rpartition("/")
+        if path.endswith("/nightlight/settings"):
+            eero = self.resources.get(path.removesuffix("/nightlight/settings"))
+            if eero is None:
+                return None
+            eero["nightlight"] = {**(eero.get("nightlight") or {}), **body}
+            return eero["nightlight"]
+        if (resource := self.resources.get(base)) is not None:
+            if action == "led":
+                resource.update(body)
+            elif action == "guestnetwork":
+                resource["guest_network"].update(body)
+            elif action in ["backupinternet", "dns", "settings"]:
+                resource.update(body)
+            return {}
+        network_url, resource = self.split(path)
+        if network_url not in self.networks:
+            return None
+        network = self.networks[network_url]
+        if resource in ["ddns/enable", "ddns/disable"]:
+            network["ddns"]["enabled"] = resource == "ddns/enable"
+        elif resource == "thread/enable":
+            network["thread"].update(body)
+        return {}
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Serve until interrupted."""
+    cloud = MockEeroCloud(
+        networks=args.networks,
+        eeros=args.eeros,
+        profiles=args.profiles,
+        clients=args.clients,
+        latency=args.latency,
+        port=args.port,
+    )
+    async with cloud:
+        print(f"Serving a synthetic eero cloud on {cloud.url}")
+        await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--networks", type=int, default=1)
+    parser.add_argument("--eeros", type=int, default=3)
+    parser.add_argument("--profiles", type=int, default=3)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    try:
+        asyncio.run(async_main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,297 @@
+"""Benchmark the integration's hot paths at a range of network sizes.
+
+Stages, each timed separately for every size:
+
+- `update`: `EeroAPI.async_update` against the synthetic cloud in
+  `mock_server.py`, or against recorded responses with `--replay`.
+- `wrappers`: building `EeroAccount`, `EeroNetwork` and the client, eero
+  and profile wrappers and indices from a decoded update.
+- `activity`: activity lookups for every client, eero and profile.
+- `entities`: state evaluation for every entity of every stateful
+  platform, as on a coordinator update. Needs Home Assistant installed
+  and is reported as skipped otherwise.
+
+Results are written as JSON to stdout, or to `--output`.
+
+Usage: python benchmarks/suite.py [--sizes 10 100 1000 5000] [--repeat 5]
+    [--replay DIRECTORY] [--output results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+import importlib
+import json
+import platform
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from common import load_api, load_integration
+from mock_server import MockEeroCloud
+
+ACTIVITIES = [
+    f"{activity}_{period}"
+    for activity in ["adblock", "blocked", "data_usage", "inspected"]
+    for period in ["day", "week", "month"]
+]
+ACTIVITY_CONFIG = {
+    "clients": [
+        activity
+        for activity in ACTIVITIES
+        if activity.startswith(("data_usage", "inspected"))
+    ],
+    "eeros": [activity for activity in ACTIVITIES if activity.startswith("data_usage")],
+    "network": ACTIVITIES,
+    "profiles": ACTIVITIES,
+}
+ENTITY_ARGUMENTS = {
+    "device_tracker": lambda: [
+        {},
+        SimpleNamespace(async_save_last_seen=lambda last_seen: None),
+    ],
+}
+ENTITY_PLATFORMS = {
+    "binary_sensor": ("EeroBinarySensorEntity", ["is_on", "extra_state_attributes"]),
+    "device_tracker": (
+        "EeroDeviceTrackerEntity",
+        ["state", "state_attributes", "extra_state_attributes"],
+    ),
+    "light": ("EeroLightEntity", ["is_on", "brightness"]),
+    "number": ("EeroNumberEntity", ["native_value"]),
+    "select": ("EeroSelectEntity", ["current_option"]),
+    "sensor": ("EeroSensorEntity", ["native_value", "extra_state_attributes"]),
+    "switch": ("EeroSwitchEntity", ["is_on", "extra_state_attributes"]),
+    "time": ("EeroTimeEntity", ["native_value"]),
+    "update": ("EeroUpdateEntity", ["installed_version", "latest_version"]),
+}
+SIZES = [10, 100, 1000, 5000]
+
+
+def summarize(stage: str, clients: int, timings: list[float], **extra) -> dict:
+    """Summarize timings in milliseconds."""
+    return {
+        "stage": stage,
+        "clients": clients,
+        "repeat": len(timings),
+        "min_ms": round(min(timings) * 1000, 3),
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "mean_ms": round(statistics.fmean(timings) * 1000, 3),
+        **extra,
+    }
+
+
+def measure(function: Callable[[], Any], repeat: int) -> list[float]:
+    """Time a function."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def async_measure(
+    function: Callable[[], Awaitable[Any]], repeat: int
+) -> list[float]:
+    """Time a coroutine function."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await function()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def update_config(api_module, data: dict[str, Any]) -> dict[str, Any]:
+    """Update config requesting every resource for every network."""
+    return {
+        network["url"].replace("/2.2/networks/", ""): api_module.EeroUpdateConfig(
+            activity=ACTIVITY_CONFIG,
+            profiles=[str(index) for index in range(1, 4)],
+            get_backup_access_points=True,
+            get_devices=True,
+            get_release_notes=True,
+        )
+        for network in data["networks"]["data"]
+    }
+
+
+async def async_bench_update(
+    api_module, clients: int, repeat: int, replay: str | None
+) -> tuple[dict, dict[str, Any]]:
+    """Benchmark `EeroAPI.async_update`, returning the last raw account data."""
+    if replay:
+        replay_module = importlib.import_module(f"{api_module.__name__}.replay")
+        transport = replay_module.EeroReplayTransport(replay)
+        api = api_module.EeroAPI(
+            user_token="benchmark",
+            websession=replay_module.EeroReplayClientSession(transport),
+            session=replay_module.EeroReplaySession(transport),
+        )
+        config = update_config(api_module, (await api.async_update()).data)
+        timings = await async_measure(lambda: api.async_update(config), repeat)
+        clients = len(api.data.networks[0].clients) if api.data.networks else 0
+        return summarize("update", clients, timings, source="replay"), api.data.data
+
+    async with (
+        MockEeroCloud(clients=clients) as cloud,
+        aiohttp.ClientSession() as session,
+    ):
+        api = api_module.EeroAPI(
+            user_token="benchmark", websession=session, api_endpoint=cloud.url
+        )
+        config = update_config(api_module, cloud.account)
+        timings = await async_measure(lambda: api.async_update(config), repeat)
+        return (
+            summarize(
+                "update",
+                clients,
+                timings,
+                source="mock",
+                requests=len(cloud.requests) // repeat,
+            ),
+            api.data.data,
+        )
+
+
+def build_account(api_module, api, data: dict[str, Any]):
+    """Build the wrappers and indices a coordinator update touches."""
+    account = api_module.EeroAccount(api, data)
+    for network in account.networks:
+        network.client_counts  # noqa: B018
+        network.clients_by_source_location  # noqa: B018
+        network.resource_map  # noqa: B018
+        for eero in network.eeros:
+            eero.connected_clients_names  # noqa: B018
+        for profile in network.profiles:
+            profile.connected_clients_names  # noqa: B018
+    return account
+
+
+def bench_wrappers(api_module, clients: int, repeat: int, data: dict) -> dict:
+    """Benchmark wrapper construction."""
+    api = api_module.EeroAPI()
+    return summarize(
+        "wrappers",
+        clients,
+        measure(lambda: build_account(api_module, api, data), repeat),
+    )
+
+
+def bench_activity(api_module, clients: int, repeat: int, data: dict) -> dict:
+    """Benchmark activity lookups on freshly built wrappers."""
+    api = api_module.EeroAPI()
+
+    def lookups() -> None:
+        for network in api_module.EeroAccount(api, data).networks:
+            for resource in [network, *network.clients, *network.eeros]:
+                for activity in ACTIVITIES:
+                    getattr(resource, activity, None)
+            for profile in network.profiles:
+                for activity in ACTIVITIES:
+                    getattr(profile, activity, None)
+
+    return summarize("activity", clients, measure(lookups, repeat))
+
+
+def bench_entities(modules: dict, clients: int, repeat: int, data: dict) -> list[dict]:
+    """Benchmark entity state evaluation per platform."""
+    api_module, const = modules["api"], modules["const"]
+    api = api_module.EeroAPI()
+    coordinator = SimpleNamespace(data=api_module.EeroAccount(api, data))
+    miscellaneous = {
+        const.CONF_CONSIDER_HOME: const.DEFAULT_CONSIDER_HOME,
+        const.CONF_PREFIX_NETWORK_NAME: False,
+        const.CONF_SUFFIX_CONNECTION_TYPE: False,
+    }
+    results = []
+    for name, (entity_class, properties) in ENTITY_PLATFORMS.items():
+        module = modules[name]
+        entity_class = getattr(module, entity_class)
+        descriptions = getattr(module, f"{name.upper()}_DESCRIPTIONS")
+        entities = []
+        for network in coordinator.data.networks:
+            for resource in [
+                network,
+                *network.backup_networks,
+                *network.clients,
+                *network.eeros,
+                *network.profiles,
+            ]:
+                resource_id = None if resource.is_network else resource.id
+                entities.extend(
+                    entity_class(
+                        coordinator,
+                        network.id,
+                        resource_id,
+                        description,
+                        miscellaneous,
+                        *ENTITY_ARGUMENTS.get(name, list)(),
+                    )
+                    for description in descriptions
+                    if hasattr(resource, description.key)
+                )
+
+        def evaluate(entities=entities, properties=properties) -> None:
+            coordinator.data = api_module.EeroAccount(api, data)
+            for entity in entities:
+                for prop in properties:
+                    getattr(entity, prop)
+
+        results.append(
+            summarize(
+                "entities",
+                clients,
+                measure(evaluate, repeat),
+                platform=name,
+                entities=len(entities),
+            )
+        )
+    return results
+
+
+async def async_main(args: argparse.Namespace) -> dict:
+    """Run the suite."""
+    api_module = load_api()
+    modules = load_integration(["api", "const", *ENTITY_PLATFORMS])
+    results, skipped = [], {}
+    if modules is None:
+        skipped["entities"] = "homeassistant is not installed"
+    for clients in [0] if args.replay else args.sizes:
+        update, data = await async_bench_update(
+            api_module, clients, args.repeat, args.replay
+        )
+        clients = update["clients"]
+        results.append(update)
+        results.append(bench_wrappers(api_module, clients, args.repeat, data))
+        results.append(bench_activity(api_module, clients, args.repeat, data))
+        if modules is not None:
+            results.extend(bench_entities(modules, clients, args.repeat, data))
+        print(f"Finished {clients} clients", file=sys.stderr)
+    return {
+        "python": platform.python_version(),
+        "orjson": api_module.util.orjson is not None,
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--replay", help="directory of recorded responses")
+    parser.add_argument("--output", help="write results to this file")
+    arguments = parser.parse_args()
+    report = json.dumps(asyncio.run(async_main(arguments)), indent=2)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            file.write(f"{report}\n")
+    else:
+        print(report)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from asyncio import timeout
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 import logging
 from typing import Any
 
@@ -13,13 +13,15 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, CONF_SCAN_INTERVAL, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import (
     config_validation as cv,
     device_registry as dr,
     entity_registry as er,
 )
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -27,7 +29,15 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from .api import EeroAPI, EeroException, EeroUpdateConfig
-from .api.const import SUPPORTED_APPS
+from .api.account import EeroAccount
+from .api.const import (
+    DATA_CLASS_ACTIVITY,
+    DATA_CLASS_NETWORK,
+    DATA_CLASS_PRESENCE,
+    DATA_CLASS_STATIC,
+    SUPPORTED_APPS,
+)
+from .api.diff import diff_accounts
 from .api.network import EeroNetwork
 from .api.resource import EeroResource
 from .config_flow import EeroConfigFlow
@@ -46,12 +56,17 @@ from .const import (
     CONF_EEROS,
     CONF_FILTER_EXCLUDE,
     CONF_FILTER_INCLUDE,
+    CONF_MAX_CONCURRENT_REQUESTS,
     CONF_MISCELLANEOUS,
     CONF_NETWORKS,
     CONF_PREFIX_NETWORK_NAME,
     CONF_PROFILES,
     CONF_RESOURCES,
     CONF_SAVE_RESPONSES,
+    CONF_SCAN_INTERVAL_ACTIVITY,
+    CONF_SCAN_INTERVAL_PRESENCE,
+    CONF_SCAN_INTERVAL_PRESENCE_FAST,
+    CONF_SCAN_INTERVAL_STATIC,
     CONF_SHOW_EERO_LOGO,
     CONF_SUFFIX_CONNECTION_TYPE,
     CONF_TIMEOUT,
@@ -62,12 +77,19 @@ from .const import (
     CONF_WIRELESS_CLIENTS_FILTER,
     DATA_API,
     DATA_COORDINATOR,
+    DATA_LAST_SEEN,
+    DATA_STORAGE,
     DATA_UPDATE_LISTENER,
     DEFAULT_CONSIDER_HOME,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
     DEFAULT_PREFIX_NETWORK_NAME,
     DEFAULT_SAVE_LOCATION,
     DEFAULT_SAVE_RESPONSES,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL_ACTIVITY,
+    DEFAULT_SCAN_INTERVAL_PRESENCE,
+    DEFAULT_SCAN_INTERVAL_PRESENCE_FAST,
+    DEFAULT_SCAN_INTERVAL_STATIC,
     DEFAULT_SHOW_EERO_LOGO,
     DEFAULT_SUFFIX_CONNECTION_TYPE,
     DEFAULT_TIMEOUT,
@@ -82,6 +104,7 @@ from .const import (
     MODEL_PROFILE,
     SERVICE_SET_BLOCKED_APPS,
 )
+from .storage import EeroStorage
 
 SET_BLOCKED_APPS_SCHEMA = vol.Schema(
     {
@@ -256,7 +279,27 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     conf_scan_interval = options.get(
         CONF_SCAN_INTERVAL, data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
     )
+    conf_scan_interval_activity = options.get(
+        CONF_SCAN_INTERVAL_ACTIVITY,
+        data.get(CONF_SCAN_INTERVAL_ACTIVITY, DEFAULT_SCAN_INTERVAL_ACTIVITY),
+    )
+    conf_scan_interval_presence = options.get(
+        CONF_SCAN_INTERVAL_PRESENCE,
+        data.get(CONF_SCAN_INTERVAL_PRESENCE, DEFAULT_SCAN_INTERVAL_PRESENCE),
+    )
+    conf_scan_interval_presence_fast = options.get(
+        CONF_SCAN_INTERVAL_PRESENCE_FAST,
+        data.get(CONF_SCAN_INTERVAL_PRESENCE_FAST, DEFAULT_SCAN_INTERVAL_PRESENCE_FAST),
+    )
+    conf_scan_interval_static = options.get(
+        CONF_SCAN_INTERVAL_STATIC,
+        data.get(CONF_SCAN_INTERVAL_STATIC, DEFAULT_SCAN_INTERVAL_STATIC),
+    )
     conf_timeout = options.get(CONF_TIMEOUT, data.get(CONF_TIMEOUT, DEFAULT_TIMEOUT))
+    conf_max_concurrent_requests = options.get(
+        CONF_MAX_CONCURRENT_REQUESTS,
+        data.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS),
+    )
 
     device_registry = dr.async_get(hass)
     entity_registry = er.async_get(hass)
@@ -383,6 +426,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
                         )
                         entity_registry.async_remove(entity_entry.entity_id)
 
+    storage = EeroStorage(hass, config_entry.entry_id)
+
     api = EeroAPI(
         save_location=DEFAULT_SAVE_LOCATION if conf_save_responses else None,
         show_eero_logo={
@@ -390,6 +435,10 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
             for network_id, miscellaneous in conf_miscellaneous.items()
         },
         user_token=data[CONF_USER_TOKEN],
+        websession=async_get_clientsession(hass),
+        max_concurrent_requests=int(conf_max_concurrent_requests),
+        max_concurrent_activity_requests=int(conf_max_concurrent_requests),
+        release_notes_cache=await storage.async_load_release_notes(),
     )
 
     conf_update = {}
@@ -418,40 +467,95 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
                 ]
             ),
             get_release_notes=True,
+            refresh_intervals={
+                DATA_CLASS_ACTIVITY: int(conf_scan_interval_activity),
+                DATA_CLASS_NETWORK: int(conf_scan_interval),
+                DATA_CLASS_PRESENCE: int(conf_scan_interval_presence),
+                DATA_CLASS_STATIC: int(conf_scan_interval_static),
+            },
         )
 
+    conf_snapshot = {
+        CONF_ACTIVITY: conf_activity,
+        CONF_NETWORKS: conf_networks,
+        CONF_RESOURCES: conf_resources,
+    }
+
     async def async_update_data():
         """Fetch data from API endpoint.
 
         This is the place to pre-process the data to lookup tables
         so entities can quickly look up their data.
         """
+        previous = api.data
         try:
             async with timeout(conf_timeout):
-                return await hass.async_add_executor_job(api.update, conf_update)
+                response = await api.async_update(conf_update)
         except EeroException as error:
             raise UpdateFailed("Error communicating with API") from error
+        if response.data:
+            api.release_notes_cache.prune(
+                {network.manifest_resource for network in response.networks}
+            )
+        storage.async_save_release_notes(api.release_notes_cache)
+        if response is not previous:
+            storage.async_save_snapshot(conf_snapshot, response)
+            async_fire_changes(previous, response)
+        return response
+
+    async def async_update_presence(now: datetime) -> None:
+        """Fetch client presence only, between coordinator updates."""
+        if not coordinator.last_update_success:
+            return
+        previous = api.data
+        try:
+            async with timeout(conf_scan_interval_presence_fast):
+                response = await api.async_update_presence(conf_update)
+        except TimeoutError:
+            _LOGGER.debug("Timed out fetching client presence")
+            return
+        if response is not previous:
+            async_fire_changes(previous, response)
+            coordinator.data = response
+            coordinator.async_update_listeners()
+
+    @callback
+    def async_fire_changes(previous: EeroAccount, response: EeroAccount) -> None:
+        for change in diff_accounts(previous, response):
+            hass.bus.async_fire(f"{DOMAIN}_{change.change_type}", change.as_dict())
 
     coordinator = DataUpdateCoordinator(
         hass=hass,
         logger=_LOGGER,
         name=f"Eero ({data[CONF_NAME]})",
         update_method=async_update_data,
-        update_interval=timedelta(seconds=conf_scan_interval),
+        update_interval=timedelta(
+            seconds=min(
+                conf_scan_interval,
+                conf_scan_interval_activity,
+                conf_scan_interval_presence,
+                conf_scan_interval_static,
+            )
+        ),
     )
-    await coordinator.async_refresh()
+    if snapshot := await storage.async_load_snapshot(conf_snapshot):
+        _LOGGER.debug("Starting from stored snapshot, refreshing in background")
+        api.data = EeroAccount(api, snapshot, restored=True)
+        coordinator.async_set_updated_data(api.data)
+    else:
+        await coordinator.async_refresh()
 
     for network in coordinator.data.networks:
         if conf_miscellaneous_network := conf_miscellaneous.get(network.id):
             conf_consider_home = conf_miscellaneous_network[CONF_CONSIDER_HOME]
             if conf_consider_home and timedelta(
                 minutes=conf_consider_home
-            ) <= timedelta(seconds=conf_scan_interval):
+            ) <= timedelta(seconds=conf_scan_interval_presence):
                 _LOGGER.info(
-                    "For network: %s - Consider home interval, %s minute(s), should be set larger than polling interval, %s seconds, otherwise it has no functionality",
+                    "For network: %s - Consider home interval, %s minute(s), should be set larger than client presence polling interval, %s seconds, otherwise it has no functionality",
                     network.name_unique,
                     int(conf_consider_home),
-                    int(conf_scan_interval),
+                    int(conf_scan_interval_presence),
                 )
 
     hass.data.setdefault(DOMAIN, {})
@@ -462,6 +566,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         CONF_RESOURCES: conf_resources,
         DATA_API: api,
         DATA_COORDINATOR: coordinator,
+        DATA_LAST_SEEN: await storage.async_load_last_seen(),
+        DATA_STORAGE: storage,
         DATA_UPDATE_LISTENER: config_entry.add_update_listener(async_update_listener),
     }
 
@@ -474,6 +580,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
             await hass.async_add_executor_job(
                 profile.set_blocked_applications, blocked_apps
             )
+            api.invalidate(profile.network.id)
         await coordinator.async_request_refresh()
 
     def _validate_network(target_network: str):
@@ -529,6 +636,21 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
+    if snapshot:
+        config_entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} refresh"
+        )
+
+    if conf_scan_interval_presence_fast:
+        config_entry.async_on_unload(
+            async_track_time_interval(
+                hass,
+                async_update_presence,
+                timedelta(seconds=conf_scan_interval_presence_fast),
+                name=f"{DOMAIN} presence",
+            )
+        )
+
     return True
 
 
@@ -539,11 +661,18 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     )
     if unload_ok:
         hass.data[DOMAIN][config_entry.entry_id][DATA_UPDATE_LISTENER]()
-        hass.data[DOMAIN].pop(config_entry.entry_id)
+        api = hass.data[DOMAIN].pop(config_entry.entry_id)[DATA_API]
+        if api.recorder:
+            await hass.async_add_executor_job(api.recorder.stop)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove a config entry."""
+    await EeroStorage(hass, config_entry.entry_id).async_remove()
+
+
 async def async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(config_entry.entry_id)
@@ -567,22 +696,51 @@ class EeroEntity(CoordinatorEntity):
         self.entity_description = description
         self.prefix_network_name = miscellaneous[CONF_PREFIX_NETWORK_NAME]
         self.suffix_connection_type = miscellaneous[CONF_SUFFIX_CONNECTION_TYPE]
+        self._fingerprint: tuple | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self._fingerprint = self.fingerprint
+
+    async def async_request_network_refresh(self) -> None:
+        """Request a refresh fetching the entity's network regardless of cadence."""
+        self.coordinator.data.api.invalidate(self.network_id)
+        await self.coordinator.async_request_refresh()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the data the entity is derived from changed."""
+        fingerprint = self.fingerprint
+        skipped = bool(fingerprint is not None and fingerprint == self._fingerprint)
+        self.coordinator.data.api.metrics.record_entity_write(skipped=skipped)
+        if skipped:
+            return
+        self._fingerprint = fingerprint
+        super()._handle_coordinator_update()
+
+    @property
+    def fingerprint(self) -> tuple | None:
+        """Return a fingerprint of the data the entity state is derived from."""
+        if not self.entity_description.skip_unchanged:
+            return None
+        return (
+            self.coordinator.last_update_success,
+            self.resource.url,
+            self.resource.fingerprint,
+        )
 
     @property
     def network(self) -> EeroNetwork | None:
         """Return the state attributes."""
-        for network in self.coordinator.data.networks:
-            if network.id == self.network_id:
-                return network
-        return None
+        return self.coordinator.data.get_network(self.network_id)
 
     @property
     def resource(self) -> EeroResource | None:
         """Return the state attributes."""
         if self.resource_id:
-            for resource in self.network.resources:
-                if resource.id == self.resource_id:
-                    return resource
+            if resource := self.network.get_resource(self.resource_id):
+                return resource
         return self.network
 
     @property
@@ -684,4 +842,5 @@ class EeroEntityDescription(EntityDescription):
     extra_attrs: dict[str, Callable] | None = None
     premium_type: bool = False
     request_refresh: bool = True
+    skip_unchanged: bool = True
     translation_key: str | None = "all"
@@ -2,24 +2,35 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
 import datetime
-import json
+from http import HTTPStatus
 import logging
-from pathlib import Path
+import time
 from typing import Any
 from zoneinfo import ZoneInfo
 
 import aiofiles
+import aiohttp
 from dateutil import relativedelta
 import requests
 
 from .account import EeroAccount
+from .activity import EeroActivityFetcher
+from .cache import EeroQRCodeCache, EeroReleaseNotesCache
 from .const import (
     ACTIVITY_MAP,
     API_ENDPOINT,
     CADENCE_DAILY,
     CADENCE_HOURLY,
+    DATA_CLASS_ACTIVITY,
+    DATA_CLASS_MAP,
+    DATA_CLASS_NETWORK,
+    DATA_CLASS_PRESENCE,
+    DATA_CLASS_STATIC,
+    DEFAULT_MAX_CONCURRENT_ACTIVITY_REQUESTS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
     EERO_LOGO_ICON,
     METHOD_DELETE,
     METHOD_GET,
@@ -28,10 +39,19 @@ from .const import (
     PERIOD_DAY,
     PERIOD_MONTH,
     PERIOD_WEEK,
+    QR_CODE_DEFAULT,
+    REFRESH_INTERVAL_TOLERANCE,
     RESOURCE_MAP,
+    STAGE_ACCOUNT,
+    STAGE_NETWORK,
+    STAGE_PRESENCE,
+    STAGE_UPDATE,
     URL_ACCOUNT,
 )
-from .util import backup_access_point_ok, premium_ok
+from .metrics import EeroMetrics
+from .projection import merge_presence, project_network, retained_bytes
+from .recorder import EeroResponseRecorder
+from .util import backup_access_point_ok, json_loads, premium_ok
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,6 +88,37 @@ class EeroException(Exception):
         _LOGGER.warning(exception)
 
 
+class EeroResponse:
+    """EeroResponse."""
+
+    def __init__(
+        self,
+        status_code: int,
+        reason: str | None,
+        content: bytes,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Initialize."""
+        self.status_code = status_code
+        self.reason = reason
+        self.content = content
+        self.url = url
+        self.headers = headers
+        if self.headers is None:
+            self.headers = {}
+
+    @property
+    def ok(self) -> bool:
+        """OK."""
+        return bool(self.status_code < 400)
+
+    @property
+    def text(self) -> str:
+        """Text."""
+        return self.content.decode(errors="replace")
+
+
 class EeroAPI:
     """EeroAPI."""
 
@@ -76,14 +127,40 @@ class EeroAPI:
         save_location: str | None = None,
         show_eero_logo: dict[str, bool] | None = None,
         user_token: str | None = None,
+        websession: aiohttp.ClientSession | None = None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        max_concurrent_activity_requests: int = (
+            DEFAULT_MAX_CONCURRENT_ACTIVITY_REQUESTS
+        ),
+        release_notes_cache: EeroReleaseNotesCache | None = None,
+        session: requests.Session | None = None,
+        api_endpoint: str = API_ENDPOINT,
     ) -> None:
         """Initialize."""
+        self.activity_semaphore = asyncio.Semaphore(max_concurrent_activity_requests)
+        self.api_endpoint = api_endpoint
+        self.activity_timings: dict[str, float] = {}
         self.data = EeroAccount(self, {})
+        self.metrics = EeroMetrics()
         self.default_qr_code: bytes | None = None
+        self.qr_code_cache = EeroQRCodeCache()
+        self.refreshed: dict[tuple[str, str], float] = {}
+        self.release_notes_cache = release_notes_cache
+        if self.release_notes_cache is None:
+            self.release_notes_cache = EeroReleaseNotesCache()
+        self.recorder = None
         self.save_location = save_location
-        self.session = requests.Session()
+        self.session = session
         self.show_eero_logo = show_eero_logo
         self.user_token = user_token
+        self.websession = websession
+        self._refresh_lock = asyncio.Lock()
+        self._request_semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self._update_lock = asyncio.Lock()
+        if self.save_location:
+            self.recorder = EeroResponseRecorder(self.save_location)
+        if self.session is None:
+            self.session = requests.Session()
         if self.show_eero_logo is None:
             self.show_eero_logo = {}
 
@@ -94,6 +171,19 @@ class EeroAPI:
             return {"s": self.user_token}
         return {}
 
+    @property
+    def retained_bytes(self) -> dict[str, dict[str, int]]:
+        """Approximate bytes retained by the current snapshot, per network.
+
+        Walks the whole snapshot, so it is computed on demand only.
+        """
+        return {
+            network["url"].replace("/2.2/networks/", ""): self.network_retained_bytes(
+                network
+            )
+            for network in self.data.data.get("networks", {}).get("data", [])
+        }
+
     def call(self, method: str, url: str, **kwargs) -> dict[str, Any]:
         """Call."""
         if method not in [METHOD_DELETE, METHOD_GET, METHOD_POST, METHOD_PUT]:
@@ -102,28 +192,66 @@ class EeroAPI:
         if method == METHOD_DELETE:
             response = self.parse_response(
                 lambda: self.session.delete(
-                    url=f"{API_ENDPOINT}{url}", cookies=self.cookie, **kwargs
-                )
+                    url=f"{self.api_endpoint}{url}", cookies=self.cookie, **kwargs
+                ),
+                method=method,
+                url=url,
             )
         elif method == METHOD_GET:
             response = self.parse_response(
                 lambda: self.session.get(
-                    url=f"{API_ENDPOINT}{url}", cookies=self.cookie, **kwargs
-                )
+                    url=f"{self.api_endpoint}{url}", cookies=self.cookie, **kwargs
+                ),
+                method=method,
+                url=url,
             )
         elif method == METHOD_POST:
             response = self.parse_response(
                 lambda: self.session.post(
-                    url=f"{API_ENDPOINT}{url}", cookies=self.cookie, **kwargs
-                )
+                    url=f"{self.api_endpoint}{url}", cookies=self.cookie, **kwargs
+                ),
+                method=method,
+                url=url,
             )
         elif method == METHOD_PUT:
             response = self.parse_response(
                 lambda: self.session.put(
-                    url=f"{API_ENDPOINT}{url}", cookies=self.cookie, **kwargs
-                )
+                    url=f"{self.api_endpoint}{url}", cookies=self.cookie, **kwargs
+                ),
+                method=method,
+                url=url,
             )
-        self.save_response(response=response, name=url)
+        self.save_response(
+            response=response,
+            name=url,
+            method=method,
+            url=url,
+            body=kwargs.get("json"),
+        )
+        return response
+
+    async def async_call(self, method: str, url: str, **kwargs) -> dict[str, Any]:
+        """Async call."""
+        if method not in [METHOD_DELETE, METHOD_GET, METHOD_POST, METHOD_PUT]:
+            return None
+        _LOGGER.debug("Calling API with method: %s and URL: %s", method, url)
+        response = await self.async_parse_response(
+            lambda: self.websession.request(
+                method=method,
+                url=f"{self.api_endpoint}{url}",
+                cookies=self.cookie,
+                **kwargs,
+            ),
+            method=method,
+            url=url,
+        )
+        await self.async_save_response(
+            response=response,
+            name=url,
+            method=method,
+            url=url,
+            body=kwargs.get("json"),
+        )
         return response
 
     def define_period(self, period: str, timezone: str) -> tuple:
@@ -166,22 +294,87 @@ class EeroAPI:
         async with aiofiles.open(EERO_LOGO_ICON, "rb") as file:
             self.default_qr_code = await file.read()
 
+    def qr_code(self, key: tuple[str, str | None, str] | str | None) -> bytes | None:
+        """QR code for a key, rendered on a cache miss."""
+        if key == QR_CODE_DEFAULT:
+            return self.default_qr_code
+        return self.qr_code_cache.get(key)
+
+    async def async_qr_code(
+        self, key: tuple[str, str | None, str] | str | None
+    ) -> bytes | None:
+        """QR code for a key, rendered in an executor on a cache miss."""
+        if any(
+            [
+                key == QR_CODE_DEFAULT,
+                self.qr_code_cache.cached(key),
+            ]
+        ):
+            return self.qr_code(key)
+        return await asyncio.get_running_loop().run_in_executor(None, self.qr_code, key)
+
     def get_release_notes(self, url: str) -> dict[str, Any] | None:
         """Get release notes."""
         if url:
-            response = self.timeout(lambda: self.session.get(url=url))
-            if not response.ok:
-                raise EeroException(
-                    code=response.status_code,
-                    error=response.reason,
-                    message=f"Unable to get release notes from URL: {url}",
-                    payload=response.text,
-                )
-            text = self.decode_json(response)
-            self.save_response(response=text, name="release_notes")
-            return text
+            if self.release_notes_cache.fresh(url):
+                return self.release_notes_cache.get(url)
+            response = self.timed(
+                lambda: self.session.get(
+                    url=url, headers=self.release_notes_cache.headers(url)
+                ),
+                method=METHOD_GET,
+                url=url,
+            )
+            release_notes = self.parse_release_notes(url=url, response=response)
+            self.save_response(
+                response=release_notes, name="release_notes", method=METHOD_GET, url=url
+            )
+            return release_notes
         return None
 
+    async def async_get_release_notes(self, url: str) -> dict[str, Any] | None:
+        """Async get release notes."""
+        if url:
+            if self.release_notes_cache.fresh(url):
+                return self.release_notes_cache.get(url)
+            response = await self.async_timed(
+                lambda: self.websession.get(
+                    url=url, headers=self.release_notes_cache.headers(url)
+                ),
+                method=METHOD_GET,
+                url=url,
+            )
+            release_notes = self.parse_release_notes(url=url, response=response)
+            await self.async_save_response(
+                response=release_notes, name="release_notes", method=METHOD_GET, url=url
+            )
+            return release_notes
+        return None
+
+    def parse_release_notes(
+        self, url: str, response: EeroResponse | requests.Response
+    ) -> dict[str, Any] | None:
+        """Parse release notes."""
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            _LOGGER.debug("Release notes not modified for URL: %s", url)
+            self.release_notes_cache.touch(url)
+            return self.release_notes_cache.get(url)
+        if not response.ok:
+            raise EeroException(
+                code=response.status_code,
+                error=response.reason,
+                message=f"Unable to get release notes from URL: {url}",
+                payload=response.text,
+            )
+        text = self.decode_json(response)
+        self.release_notes_cache.set(
+            url=url,
+            release_notes=text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return text
+
     def login(self, login: str | int) -> dict[str, Any]:
         """Login."""
         _LOGGER.debug("Using login: %s", login)
@@ -196,6 +389,7 @@ class EeroAPI:
     def login_refresh(self) -> dict[str, Any]:
         """Login refresh."""
         _LOGGER.debug("Refreshing session")
+        self.metrics.record_session_refresh()
         response = self.call(
             method=METHOD_POST,
             url="/2.2/login/refresh",
@@ -203,6 +397,30 @@ class EeroAPI:
         self.user_token = response["user_token"]
         return response
 
+    async def async_login_refresh(self, user_token: str | None) -> None:
+        """Async login refresh."""
+        async with self._refresh_lock:
+            if user_token != self.user_token:
+                _LOGGER.debug("Session has already been refreshed")
+                return
+            _LOGGER.debug("Refreshing session")
+            self.metrics.record_session_refresh()
+            response = await self.async_timed(
+                lambda: self.websession.post(
+                    url=f"{self.api_endpoint}/2.2/login/refresh", cookies=self.cookie
+                ),
+                method=METHOD_POST,
+                url="/2.2/login/refresh",
+            )
+            if not response.ok:
+                raise EeroException(
+                    code=response.status_code,
+                    error=response.reason,
+                    message="Unable to refresh session",
+                    payload=response.text,
+                )
+            self.user_token = self.decode_json(response)["data"]["user_token"]
+
     def login_verify(self, code: str) -> dict[str, Any]:
         """Login verify."""
         _LOGGER.debug("Verifying login with code: %s", code)
@@ -212,11 +430,11 @@ class EeroAPI:
             json={"code": code},
         )
 
-    def decode_json(self, response: requests.Response) -> dict[str, Any]:
+    def decode_json(self, response: requests.Response | EeroResponse) -> dict[str, Any]:
         """Decode JSON."""
         try:
-            return json.loads(response.text)
-        except json.decoder.JSONDecodeError as exception:
+            return json_loads(response.content)
+        except ValueError as exception:
             raise EeroException(
                 code=response.status_code,
                 error=response.reason,
@@ -224,9 +442,14 @@ class EeroAPI:
                 payload=response.text,
             ) from exception
 
-    def parse_response(self, function: Callable) -> dict[str, Any]:
+    def parse_response(
+        self,
+        function: Callable,
+        method: str | None = None,
+        url: str | None = None,
+    ) -> dict[str, Any]:
         """Parse response."""
-        response = self.timeout(function)
+        response = self.timed(function, method=method, url=url)
         if not response.ok:
             text = self.decode_json(response)
             meta = text.get("meta", {})
@@ -244,7 +467,46 @@ class EeroAPI:
             ):
                 _LOGGER.debug("Session has expired and is invalid")
                 self.login_refresh()
-                response = self.timeout(function)
+                self.metrics.record_retry(method=method, url=url)
+                response = self.timed(function, method=method, url=url)
+            else:
+                raise EeroException(
+                    code=response.status_code,
+                    error=response.reason,
+                    message=f"Bad response received from URL: {response.url}",
+                    payload=response.text,
+                )
+        text = self.decode_json(response)
+        return text.get("data")
+
+    async def async_parse_response(
+        self,
+        function: Callable,
+        method: str | None = None,
+        url: str | None = None,
+    ) -> dict[str, Any]:
+        """Async parse response."""
+        user_token = self.user_token
+        response = await self.async_timed(function, method=method, url=url)
+        if not response.ok:
+            text = self.decode_json(response)
+            meta = text.get("meta", {})
+            code, error = meta.get("code"), meta.get("error")
+            if all(
+                [
+                    code == 401,
+                    any(
+                        [
+                            error == "error.session.invalid",
+                            error == "error.session.refresh",
+                        ]
+                    ),
+                ]
+            ):
+                _LOGGER.debug("Session has expired and is invalid")
+                await self.async_login_refresh(user_token=user_token)
+                self.metrics.record_retry(method=method, url=url)
+                response = await self.async_timed(function, method=method, url=url)
             else:
                 raise EeroException(
                     code=response.status_code,
@@ -255,6 +517,66 @@ class EeroAPI:
         text = self.decode_json(response)
         return text.get("data")
 
+    def timed(
+        self,
+        function: Callable,
+        method: str | None = None,
+        url: str | None = None,
+    ) -> requests.Response:
+        """Timed."""
+        start = time.monotonic()
+        try:
+            response = self.timeout(function)
+        except EeroException:
+            self.metrics.record_request(
+                method=method, url=url, latency=time.monotonic() - start, error=True
+            )
+            raise
+        self.metrics.record_request(
+            method=method,
+            url=url,
+            latency=time.monotonic() - start,
+            size=len(response.content),
+            error=not response.ok,
+        )
+        return response
+
+    async def async_timed(
+        self,
+        function: Callable,
+        method: str | None = None,
+        url: str | None = None,
+    ) -> EeroResponse:
+        """Async timed."""
+        start = time.monotonic()
+        try:
+            response = await self.async_timeout(function)
+        except EeroException:
+            self.metrics.record_request(
+                method=method, url=url, latency=time.monotonic() - start, error=True
+            )
+            raise
+        self.metrics.record_request(
+            method=method,
+            url=url,
+            latency=time.monotonic() - start,
+            size=len(response.content),
+            error=not response.ok,
+        )
+        return response
+
+    async def async_stage(
+        self, stage: str, awaitable: Awaitable, network_id: str | None = None
+    ) -> Any:
+        """Async stage, timed per network when a network ID is given."""
+        start = time.monotonic()
+        try:
+            return await awaitable
+        finally:
+            self.metrics.record_stage(
+                stage, time.monotonic() - start, network_id=network_id
+            )
+
     def timeout(self, function: Callable) -> requests.Response:
         """Timeout."""
         try:
@@ -264,24 +586,52 @@ class EeroAPI:
                 message="Request timed out",
             ) from exception
 
-    def save_response(self, response: dict[str, Any] | None, name="response") -> None:
-        """Save response."""
-        if self.save_location and response:
-            if not Path(self.save_location).is_dir():
-                _LOGGER.debug("Creating directory: %s", self.save_location)
-                Path(self.save_location).mkdir()
-            name = name.replace("/", "_").replace(".", "_")
-            file_path_name = f"{self.save_location}/{name}.json"
-            _LOGGER.debug("Saving response: %s", file_path_name)
-            with Path(file_path_name).open(mode="w", encoding="utf-8") as file:
-                json.dump(
-                    obj=response,
-                    fp=file,
-                    indent=4,
-                    default=lambda o: "not-serializable",
-                    sort_keys=True,
+    async def async_timeout(self, function: Callable) -> EeroResponse:
+        """Async timeout."""
+        try:
+            async with self._request_semaphore, function() as response:
+                return EeroResponse(
+                    status_code=response.status,
+                    reason=response.reason,
+                    content=await response.read(),
+                    url=str(response.url),
+                    headers=response.headers,
                 )
-            file.close()
+        except TimeoutError as exception:
+            raise EeroException(
+                message="Request timed out",
+            ) from exception
+        except aiohttp.ClientError as exception:
+            raise EeroException(
+                message=f"Request failed: {exception}",
+            ) from exception
+
+    async def async_save_response(
+        self,
+        response: dict[str, Any] | None,
+        name="response",
+        method: str | None = None,
+        url: str | None = None,
+        body: Any = None,
+    ) -> None:
+        """Async save response."""
+        self.save_response(
+            response=response, name=name, method=method, url=url, body=body
+        )
+
+    def save_response(
+        self,
+        response: dict[str, Any] | None,
+        name="response",
+        method: str | None = None,
+        url: str | None = None,
+        body: Any = None,
+    ) -> None:
+        """Save response."""
+        if self.recorder and response:
+            self.recorder.record(
+                name=name, response=response, method=method, url=url, body=body
+            )
 
     def update(
         self,
@@ -302,7 +652,7 @@ class EeroAPI:
                         network_id in config,
                     ]
                 ):
-                    network_data = self.call(method=METHOD_GET, url=network_url)
+                    network_data = dict(self.call(method=METHOD_GET, url=network_url))
                     network_data["thread"] = self.call(
                         method=METHOD_GET,
                         url=network_data["resources"]["thread"],
@@ -363,7 +713,7 @@ class EeroAPI:
                             network_data, "profiles"
                         )
 
-                    update_data = network_data["updates"]
+                    update_data = dict(network_data["updates"])
                     if config.get(network_id, EeroUpdateConfig()).get_release_notes:
                         update_data["release_notes"] = self.get_release_notes(
                             url=update_data["manifest_resource"],
@@ -403,14 +753,387 @@ class EeroAPI:
                                     )
                                 )
                     network_data["activity"] = activity_data
-                    networks.append(network_data)
-            account["networks"]["data"] = networks
+                    networks.append(
+                        self.project_network(
+                            network_id=network_id, network_data=network_data
+                        )
+                    )
+            account = {
+                **account,
+                "networks": {**account["networks"], "data": networks},
+            }
             self.save_response(response=account, name="update_data")
             self.data = EeroAccount(self, account)
         except EeroException:
             return self.data
         return self.data
 
+    async def async_update(
+        self,
+        config: dict[str, EeroUpdateConfig] | None = None,
+    ) -> EeroAccount:
+        """Async update.
+
+        An update without a config, such as for the options flow, is a one-off
+        fetch leaving the current snapshot and refresh times untouched.
+        """
+        if config is None:
+            config = {}
+        refreshed = {}
+        start = time.monotonic()
+        async with self._update_lock:
+            try:
+                if any(
+                    [
+                        not self.data.data,
+                        not config,
+                        any(
+                            self.refresh_due(
+                                network_id, DATA_CLASS_NETWORK, update_config
+                            )
+                            for network_id, update_config in config.items()
+                        ),
+                    ]
+                ):
+                    account = await self.async_stage(
+                        STAGE_ACCOUNT,
+                        self.async_call(method=METHOD_GET, url=URL_ACCOUNT),
+                    )
+                else:
+                    account = self.data.data
+                previous = {
+                    network["url"]: network
+                    for network in self.data.data.get("networks", {}).get("data", [])
+                }
+                networks = await asyncio.gather(
+                    *[
+                        self.async_stage(
+                            STAGE_UPDATE,
+                            self.async_update_network(
+                                network_url=network["url"],
+                                config=config,
+                                previous=previous.get(network["url"]),
+                                refreshed=refreshed,
+                            ),
+                            network_id=network["url"].replace("/2.2/networks/", ""),
+                        )
+                        for network in account["networks"]["data"]
+                        if any(
+                            [
+                                not config,
+                                network["url"].replace("/2.2/networks/", "") in config,
+                            ]
+                        )
+                    ]
+                )
+                account = {
+                    **account,
+                    "networks": {**account["networks"], "data": list(networks)},
+                }
+                await self.async_save_response(response=account, name="update_data")
+                self.metrics.record_stage(STAGE_UPDATE, time.monotonic() - start)
+                if not config:
+                    return EeroAccount(self, account)
+                self.data = EeroAccount(self, account)
+                self.refreshed.update(refreshed)
+            except EeroException:
+                return self.data
+            return self.data
+
+    async def async_update_presence(
+        self,
+        config: dict[str, EeroUpdateConfig] | None = None,
+    ) -> EeroAccount:
+        """Async update presence.
+
+        Fast lane refreshing only the devices of every network in the
+        current snapshot, leaving everything else to `async_update`. Skipped
+        while a full update is in progress.
+        """
+        if config is None:
+            config = {}
+        if any(
+            [
+                not self.data.data,
+                self._update_lock.locked(),
+            ]
+        ):
+            return self.data
+        start = time.monotonic()
+        async with self._update_lock:
+            networks = self.data.data.get("networks", {}).get("data", [])
+            targets = [
+                network
+                for network in networks
+                if all(
+                    [
+                        "devices" in network.get("resources", {}),
+                        any(
+                            [
+                                not config,
+                                config.get(
+                                    network["url"].replace("/2.2/networks/", ""),
+                                    EeroUpdateConfig(get_devices=False),
+                                ).get_devices,
+                            ]
+                        ),
+                    ]
+                )
+            ]
+            if not targets:
+                return self.data
+            try:
+                devices = await asyncio.gather(
+                    *[
+                        self.async_get_resource_data(network, "devices")
+                        for network in targets
+                    ]
+                )
+            except EeroException:
+                return self.data
+            devices = {
+                network["url"]: merge_presence(network.get("devices"), data)
+                for network, data in zip(targets, devices, strict=True)
+            }
+            self.metrics.record_stage(STAGE_PRESENCE, time.monotonic() - start)
+            if all(
+                devices[network["url"]] is network.get("devices") for network in targets
+            ):
+                return self.data
+            account = {
+                **self.data.data,
+                "networks": {
+                    **self.data.data["networks"],
+                    "data": [
+                        {**network, "devices": devices[network["url"]]}
+                        if network["url"] in devices
+                        else network
+                        for network in networks
+                    ],
+                },
+            }
+            self.data = EeroAccount(self, account)
+        return self.data
+
+    async def async_update_network(
+        self,
+        network_url: str,
+        config: dict[str, EeroUpdateConfig],
+        previous: dict[str, Any] | None = None,
+        refreshed: dict[tuple[str, str], float] | None = None,
+    ) -> dict[str, Any]:
+        """Async update network."""
+        network_id = network_url.replace("/2.2/networks/", "")
+        update_config = config.get(network_id, EeroUpdateConfig())
+        if previous is None:
+            previous = {}
+        if refreshed is None:
+            refreshed = {}
+        due = {
+            data_class: any(
+                [
+                    not previous,
+                    self.refresh_due(network_id, data_class, update_config),
+                ]
+            )
+            for data_class in DATA_CLASS_MAP
+        }
+        for data_class, data_class_due in due.items():
+            if data_class_due:
+                refreshed[(network_id, data_class)] = time.monotonic()
+
+        if due[DATA_CLASS_NETWORK]:
+            network_data = dict(
+                await self.async_stage(
+                    STAGE_NETWORK,
+                    self.async_call(method=METHOD_GET, url=network_url),
+                    network_id=network_id,
+                )
+            )
+        else:
+            network_data = dict(previous)
+        network_data["updates"] = dict(network_data.get("updates", {}))
+        for data_class, keys in DATA_CLASS_MAP.items():
+            if due[data_class]:
+                continue
+            for key in keys:
+                if key == "release_notes":
+                    if "release_notes" in previous.get("updates", {}):
+                        network_data["updates"]["release_notes"] = previous["updates"][
+                            "release_notes"
+                        ]
+                elif key in previous:
+                    network_data[key] = previous[key]
+
+        tasks = {}
+
+        if due[DATA_CLASS_STATIC]:
+            tasks["thread"] = self.async_call(
+                method=METHOD_GET,
+                url=network_data["resources"]["thread"],
+            )
+
+        if all(
+            [
+                due[DATA_CLASS_STATIC],
+                any(
+                    [
+                        not config,
+                        update_config.get_backup_access_points,
+                    ]
+                ),
+                backup_access_point_ok(
+                    capable=network_data["capabilities"]["backup_access_point"][
+                        "capable"
+                    ],
+                    requirements=network_data["capabilities"]["backup_access_point"][
+                        "requirements"
+                    ],
+                ),
+                premium_ok(
+                    capable=network_data["capabilities"]["premium"]["capable"],
+                    status=network_data["premium_status"],
+                ),
+            ]
+        ):
+            tasks["backup_access_points"] = self.async_get_backup_access_points(
+                network_url=network_url,
+            )
+
+        if all(
+            [
+                due[DATA_CLASS_PRESENCE],
+                any(
+                    [
+                        not config,
+                        update_config.get_devices,
+                    ]
+                ),
+            ]
+        ):
+            tasks["devices"] = self.async_get_resource_data(network_data, "devices")
+
+        if all(
+            [
+                due[DATA_CLASS_PRESENCE],
+                any(
+                    [
+                        not config,
+                        update_config.get_profiles,
+                    ]
+                ),
+            ]
+        ):
+            tasks["profiles"] = self.async_get_resource_data(network_data, "profiles")
+
+        if all(
+            [
+                due[DATA_CLASS_STATIC],
+                update_config.get_release_notes,
+            ]
+        ):
+            tasks["release_notes"] = self.async_get_release_notes(
+                url=network_data["updates"]["manifest_resource"],
+            )
+
+        if due[DATA_CLASS_ACTIVITY]:
+            tasks["activity"] = EeroActivityFetcher(
+                api=self,
+                network_url=network_url,
+                timezone=network_data["timezone"]["value"],
+                activity=update_config.activity,
+                profiles=update_config.profiles,
+            ).async_fetch()
+
+        results = dict(
+            zip(
+                tasks.keys(),
+                await asyncio.gather(
+                    *[
+                        self.async_stage(stage, task, network_id=network_id)
+                        for stage, task in tasks.items()
+                    ]
+                ),
+                strict=True,
+            )
+        )
+        if "release_notes" in results:
+            network_data["updates"]["release_notes"] = results.pop("release_notes")
+        network_data.update(results)
+        network_data = self.project_network(
+            network_id=network_id, network_data=network_data
+        )
+        for data_class, keys in DATA_CLASS_MAP.items():
+            if due[data_class]:
+                continue
+            for key in keys:
+                if key in previous and key in network_data:
+                    network_data[key] = previous[key]
+        return network_data
+
+    def project_network(
+        self, network_id: str, network_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Project network."""
+        network_data = project_network(network_data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Retained bytes for network: %s - %s",
+                network_id,
+                self.network_retained_bytes(network_data),
+            )
+        return network_data
+
+    @staticmethod
+    def network_retained_bytes(network_data: dict[str, Any]) -> dict[str, int]:
+        """Approximate bytes retained by a network's data, per resource."""
+        network_retained_bytes = {
+            key: retained_bytes(network_data.get(key))
+            for key in [
+                "activity",
+                "backup_access_points",
+                "devices",
+                "eeros",
+                "profiles",
+            ]
+        }
+        network_retained_bytes["network"] = retained_bytes(network_data) - sum(
+            network_retained_bytes.values()
+        )
+        return network_retained_bytes
+
+    def invalidate(self, network_id: str) -> None:
+        """Make every data class of a network but activity due on the next update."""
+        for data_class in DATA_CLASS_MAP:
+            if data_class != DATA_CLASS_ACTIVITY:
+                self.refreshed.pop((network_id, data_class), None)
+
+    def refresh_due(
+        self,
+        network_id: str,
+        data_class: str,
+        update_config: EeroUpdateConfig,
+    ) -> bool:
+        """Refresh due."""
+        refreshed = self.refreshed.get((network_id, data_class))
+        if refreshed is None:
+            return True
+        interval = update_config.refresh_intervals.get(data_class, 0)
+        return bool(
+            time.monotonic() - refreshed >= interval - REFRESH_INTERVAL_TOLERANCE
+        )
+
+    async def async_get_backup_access_points(self, network_url: str) -> dict:
+        """Async get backup access points."""
+        backup_access_points = await self.async_call(
+            method=METHOD_GET,
+            url=f"{network_url}/backup_access_points",
+        )
+        return {
+            "count": len(backup_access_points),
+            "data": backup_access_points,
+        }
+
     def get_resource_data(
         self,
         network_data: dict,
@@ -426,6 +1149,21 @@ class EeroAPI:
             "data": resource_data,
         }
 
+    async def async_get_resource_data(
+        self,
+        network_data: dict,
+        resource: str,
+    ) -> dict:
+        """Async get resource data."""
+        resource_data = await self.async_call(
+            method=METHOD_GET,
+            url=network_data["resources"][resource],
+        )
+        return {
+            "count": len(resource_data),
+            "data": resource_data,
+        }
+
     def update_activity(
         self,
         activity: str,
@@ -435,6 +1173,52 @@ class EeroAPI:
         timezone: str,
     ) -> list[dict]:
         """Update activity."""
+        activity_url, json_data = self.define_activity_request(
+            activity=activity,
+            network_url=network_url,
+            profile_id=profile_id,
+            resource=resource,
+            timezone=timezone,
+        )
+        data = self.call(
+            method=METHOD_GET,
+            url=activity_url,
+            json=json_data,
+        )
+        return data.get("insights", data.get("series", data.get("values")))
+
+    async def async_update_activity(
+        self,
+        activity: str,
+        network_url: str,
+        profile_id: int,
+        resource: str,
+        timezone: str,
+    ) -> list[dict]:
+        """Async update activity."""
+        activity_url, json_data = self.define_activity_request(
+            activity=activity,
+            network_url=network_url,
+            profile_id=profile_id,
+            resource=resource,
+            timezone=timezone,
+        )
+        data = await self.async_call(
+            method=METHOD_GET,
+            url=activity_url,
+            json=json_data,
+        )
+        return data.get("insights", data.get("series", data.get("values")))
+
+    def define_activity_request(
+        self,
+        activity: str,
+        network_url: str,
+        profile_id: int,
+        resource: str,
+        timezone: str,
+    ) -> tuple[str, dict[str, Any]]:
+        """Define activity request."""
         activity_url = ACTIVITY_MAP[activity][0].format(network_url)
         if resource != "network":
             activity_url = f"{activity_url}/{resource}"
@@ -452,12 +1236,7 @@ class EeroAPI:
         }
         if ACTIVITY_MAP[activity][1]:
             json_data["insight_type"] = ACTIVITY_MAP[activity][1]
-        data = self.call(
-            method=METHOD_GET,
-            url=activity_url,
-            json=json_data,
-        )
-        return data.get("insights", data.get("series", data.get("values")))
+        return (activity_url, json_data)
 
 
 class EeroUpdateConfig:
@@ -470,10 +1249,12 @@ class EeroUpdateConfig:
         get_backup_access_points: bool = False,
         get_devices: bool = False,
         get_release_notes: bool = False,
+        refresh_intervals: dict[str, int] | None = None,
     ) -> None:
         """Initialize."""
         self.activity = activity
         self.profiles = profiles
+        self.refresh_intervals = refresh_intervals
         self.get_backup_access_points = get_backup_access_points
         self.get_devices = get_devices
         self.get_profiles = bool(profiles)
@@ -482,3 +1263,5 @@ class EeroUpdateConfig:
             self.activity = {}
         if self.profiles is None:
             self.profiles = []
+        if self.refresh_intervals is None:
+            self.refresh_intervals = {}
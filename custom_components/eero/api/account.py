@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import cached_property
+
 from .network import EeroNetwork
 from .resource import EeroResource
 
@@ -9,9 +11,10 @@ from .resource import EeroResource
 class EeroAccount(EeroResource):
     """EeroAccount."""
 
-    def __init__(self, api, data) -> None:
+    def __init__(self, api, data, restored: bool = False) -> None:
         """Initialize."""
         super().__init__(api=api, network=None, data=data)
+        self.restored = restored
 
     @property
     def email(self) -> str | None:
@@ -38,7 +41,19 @@ class EeroAccount(EeroResource):
         """Premium status."""
         return self.data.get("premium_status")
 
-    @property
+    def get_network(self, network_id: str) -> EeroNetwork | None:
+        """Get network."""
+        return self.network_map.get(network_id)
+
+    @cached_property
+    def network_map(self) -> dict[str, EeroNetwork]:
+        """Network map."""
+        network_map = {}
+        for network in self.networks:
+            network_map.setdefault(network.id, network)
+        return network_map
+
+    @cached_property
     def networks(self) -> list[EeroNetwork | None]:
         """Networks."""
         return [
@@ -0,0 +1,264 @@
+"""Eero API."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+import logging
+import math
+import time
+from typing import Any
+
+from .const import ACTIVITY_MAP, PERIOD_MONTH, PERIOD_WEEK, RESOURCE_MAP
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def derive_activity(data: list[dict] | None, start: str, end: str) -> list[dict] | None:
+    """Derive activity for a narrower period from a wider series.
+
+    Returns None, so the period is fetched directly, unless every series
+    carries values that reproduce its own sum.
+    """
+    if not isinstance(data, list):
+        return None
+    start, end = datetime.fromisoformat(start), datetime.fromisoformat(end)
+    derived = []
+    for series in data:
+        if any(
+            [
+                not isinstance(series.get("values"), list),
+                not series.get("values"),
+            ]
+        ):
+            return None
+        if "sum" in series and not math.isclose(
+            series["sum"] or 0,
+            sum(value.get("value") or 0 for value in series["values"]),
+        ):
+            return None
+        values = []
+        for value in series["values"]:
+            if "time" not in value or "value" not in value:
+                return None
+            value_time = datetime.fromisoformat(value["time"])
+            if value_time.tzinfo is None:
+                return None
+            if start <= value_time <= end:
+                values.append(value)
+        derived.append(
+            {
+                **series,
+                "sum": sum(value["value"] or 0 for value in values),
+                "values": values,
+            }
+        )
+    return derived
+
+
+class EeroActivityRequest:
+    """EeroActivityRequest."""
+
+    def __init__(
+        self,
+        activity: str,
+        network_url: str,
+        profile_id: str | None,
+        resource: str,
+        timezone: str,
+    ) -> None:
+        """Initialize."""
+        self.activity = activity
+        self.network_url = network_url
+        self.profile_id = profile_id
+        self.resource = resource
+        self.timezone = timezone
+        self.duration: float | None = None
+        self.source: EeroActivityRequest | None = None
+
+    @property
+    def key(self) -> tuple[str, str, str | None]:
+        """Key."""
+        return (self.resource, self.activity, self.profile_id)
+
+    @property
+    def derivable(self) -> bool:
+        """Derivable.
+
+        Only profile activity and network data usage come as series with
+        values. Network insights and device or eero payloads carry entries
+        with only a sum, so their week can not be sliced out of the month.
+        """
+        return any(
+            [
+                self.resource == "profiles",
+                all(
+                    [
+                        self.resource == "network",
+                        ACTIVITY_MAP[self.activity][1] is None,
+                    ]
+                ),
+            ]
+        )
+
+    @property
+    def family(self) -> tuple[str, str, str | None, str, str | None]:
+        """Family."""
+        url, insight_type, _ = ACTIVITY_MAP[self.activity]
+        return (self.resource, self.network_url, self.profile_id, url, insight_type)
+
+    @property
+    def name(self) -> str:
+        """Name."""
+        name = f"{self.network_url}/{self.resource}/{self.activity}"
+        if self.profile_id:
+            return f"{name}/{self.profile_id}"
+        return name
+
+
+class EeroActivityFetcher:
+    """EeroActivityFetcher."""
+
+    def __init__(
+        self,
+        api,
+        network_url: str,
+        timezone: str,
+        activity: dict[str, list[str]],
+        profiles: list[str],
+    ) -> None:
+        """Initialize."""
+        self.api = api
+        self.network_url = network_url
+        self.timezone = timezone
+        self.activity = activity
+        self.profiles = profiles
+
+    @property
+    def requests(self) -> list[EeroActivityRequest]:
+        """Requests."""
+        requests = []
+        for resource, activities in self.activity.items():
+            resource = RESOURCE_MAP.get(resource, resource)
+            profile_ids = self.profiles if resource == "profiles" else [None]
+            requests.extend(
+                EeroActivityRequest(
+                    activity=activity,
+                    network_url=self.network_url,
+                    profile_id=profile_id,
+                    resource=resource,
+                    timezone=self.timezone,
+                )
+                for activity in activities
+                for profile_id in profile_ids
+            )
+        if self.week_within_month:
+            months = {
+                request.family: request
+                for request in requests
+                if ACTIVITY_MAP[request.activity][2] == PERIOD_MONTH
+            }
+            for request in requests:
+                if all(
+                    [
+                        ACTIVITY_MAP[request.activity][2] == PERIOD_WEEK,
+                        request.derivable,
+                    ]
+                ):
+                    request.source = months.get(request.family)
+        return requests
+
+    @property
+    def week_within_month(self) -> bool:
+        """Week within month."""
+        week_start, week_end, _ = self.api.define_period(PERIOD_WEEK, self.timezone)
+        month_start, month_end, _ = self.api.define_period(PERIOD_MONTH, self.timezone)
+        return bool(month_start <= week_start and week_end <= month_end)
+
+    async def async_fetch(self) -> dict[str, Any]:
+        """Async fetch."""
+        requests = self.requests
+        fetched = [request for request in requests if request.source is None]
+        results = dict(
+            zip(
+                fetched,
+                await asyncio.gather(
+                    *[self.async_fetch_request(request) for request in fetched]
+                ),
+                strict=True,
+            )
+        )
+
+        fallback = []
+        for request in requests:
+            if request.source is None:
+                continue
+            start, end, _ = self.api.define_period(PERIOD_WEEK, self.timezone)
+            data = derive_activity(results[request.source], start, end)
+            if data is None:
+                fallback.append(request)
+            else:
+                request.duration = 0.0
+                results[request] = data
+        if fallback:
+            _LOGGER.debug(
+                "Unable to derive %s activity series for network: %s, fetching directly",
+                len(fallback),
+                self.network_url,
+            )
+            fetched.extend(fallback)
+            results.update(
+                zip(
+                    fallback,
+                    await asyncio.gather(
+                        *[self.async_fetch_request(request) for request in fallback]
+                    ),
+                    strict=True,
+                )
+            )
+
+        if fetched:
+            slowest = max(fetched, key=lambda request: request.duration)
+            _LOGGER.debug(
+                "Fetched %s of %s activity series for network: %s in %.3f seconds (slowest: %s in %.3f seconds)",
+                len(fetched),
+                len(requests),
+                self.network_url,
+                sum(request.duration for request in fetched),
+                slowest.name,
+                slowest.duration,
+            )
+        return self.assemble(results)
+
+    async def async_fetch_request(self, request: EeroActivityRequest) -> list[dict]:
+        """Async fetch request."""
+        async with self.api.activity_semaphore:
+            start = time.monotonic()
+            try:
+                return await self.api.async_update_activity(
+                    activity=request.activity,
+                    network_url=request.network_url,
+                    profile_id=request.profile_id,
+                    resource=request.resource,
+                    timezone=request.timezone,
+                )
+            finally:
+                request.duration = time.monotonic() - start
+                self.api.activity_timings[request.name] = request.duration
+
+    def assemble(self, results: dict[EeroActivityRequest, list[dict]]) -> dict:
+        """Assemble."""
+        activity_data = {}
+        for resource, activities in self.activity.items():
+            resource = RESOURCE_MAP.get(resource, resource)
+            activity_data[resource] = {}
+            for activity in activities:
+                if resource == "profiles":
+                    activity_data[resource][activity] = {}
+        for request, data in results.items():
+            resource, activity, profile_id = request.key
+            if resource == "profiles":
+                activity_data[resource][activity][profile_id] = data
+            else:
+                activity_data[resource][activity] = data
+        return activity_data
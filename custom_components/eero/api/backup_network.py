@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from .const import METHOD_PUT
+from .const import METHOD_PUT, QR_CODE_DEFAULT
 from .resource import EeroResource
-from .util import generate_qr_code
+from .util import qr_code_key
 
 
 class EeroBackupNetwork(EeroResource):
@@ -72,14 +72,19 @@ class EeroBackupNetwork(EeroResource):
     @property
     def qr_code(self) -> bytes | None:
         """QR code."""
+        return self.api.qr_code(self.qr_code_key)
+
+    @property
+    def qr_code_key(self) -> tuple[str, str | None, str] | str | None:
+        """QR code key."""
         if all(
             [
                 not self.auto_join_enabled,
                 self.api.show_eero_logo.get(self.network.id),
             ]
         ):
-            return self.api.default_qr_code
-        return generate_qr_code(
+            return QR_CODE_DEFAULT
+        return qr_code_key(
             ssid=self.ssid,
             password=self.password,
         )
@@ -0,0 +1,122 @@
+"""Eero API."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+import time
+from typing import Any
+
+from .const import DEFAULT_QR_CODE_CACHE_SIZE, DEFAULT_RELEASE_NOTES_TTL
+from .util import generate_qr_code
+
+
+class EeroReleaseNotesCache:
+    """EeroReleaseNotesCache."""
+
+    def __init__(
+        self,
+        data: dict[str, dict[str, Any]] | None = None,
+        ttl: int = DEFAULT_RELEASE_NOTES_TTL,
+    ) -> None:
+        """Initialize."""
+        self.data = data
+        self.ttl = ttl
+        self.dirty = False
+        if self.data is None:
+            self.data = {}
+
+    def fresh(self, url: str) -> bool:
+        """Fresh."""
+        if entry := self.data.get(url):
+            return bool(time.time() - entry["fetched"] < self.ttl)
+        return False
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        """Get."""
+        if entry := self.data.get(url):
+            return entry["release_notes"]
+        return None
+
+    def headers(self, url: str) -> dict[str, str]:
+        """Headers."""
+        headers = {}
+        if entry := self.data.get(url):
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def set(
+        self,
+        url: str,
+        release_notes: dict[str, Any] | None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Set."""
+        self.data[url] = {
+            "etag": etag,
+            "fetched": time.time(),
+            "last_modified": last_modified,
+            "release_notes": release_notes,
+        }
+        self.dirty = True
+
+    def prune(self, urls: set[str | None]) -> None:
+        """Drop entries for manifests no network references anymore."""
+        for url in set(self.data) - urls:
+            del self.data[url]
+            self.dirty = True
+
+    def touch(self, url: str) -> None:
+        """Touch."""
+        if entry := self.data.get(url):
+            entry["fetched"] = time.time()
+            self.dirty = True
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """As dict."""
+        self.dirty = False
+        return {url: dict(entry) for url, entry in self.data.items()}
+
+
+class EeroQRCodeCache:
+    """EeroQRCodeCache.
+
+    Least recently used cache of rendered QR code PNGs, keyed by
+    `(ssid, password, auth_type)`. Safe to render from executor threads.
+    """
+
+    def __init__(self, size: int = DEFAULT_QR_CODE_CACHE_SIZE) -> None:
+        """Initialize."""
+        self.data: OrderedDict[tuple[str, str | None, str], bytes | None] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.size = size
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str | None, str] | None) -> bytes | None:
+        """Get, rendering and storing the image on a miss."""
+        if key is None:
+            return None
+        with self._lock:
+            if key in self.data:
+                self.hits += 1
+                self.data.move_to_end(key)
+                return self.data[key]
+            self.misses += 1
+        image = generate_qr_code(ssid=key[0], password=key[1])
+        with self._lock:
+            self.data[key] = image
+            self.data.move_to_end(key)
+            while len(self.data) > self.size:
+                self.data.popitem(last=False)
+        return image
+
+    def cached(self, key: tuple[str, str | None, str] | None) -> bool:
+        """Cached."""
+        return key is None or key in self.data
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 import logging
+from typing import Any
 
 from .const import DEVICE_CATEGORY_TYPE_MAP, METHOD_PUT
 from .resource import EeroResource
@@ -17,73 +18,55 @@ class EeroClient(EeroResource):
     @property
     def adblock_day(self) -> int | None:
         """Adblock day."""
-        for device in (
-            self.network.data.get("activity", {})
-            .get("network", {})
-            .get("adblock_day", [])
+        if device := self.network.get_activity(
+            "network", "adblock_day", self.url_insights
         ):
-            if device["insights_url"] == self.url_insights:
-                return device["sum"]
+            return device["sum"]
         return None
 
     @property
     def adblock_month(self) -> int | None:
         """Adblock month."""
-        for device in (
-            self.network.data.get("activity", {})
-            .get("network", {})
-            .get("adblock_month", [])
+        if device := self.network.get_activity(
+            "network", "adblock_month", self.url_insights
         ):
-            if device["insights_url"] == self.url_insights:
-                return device["sum"]
+            return device["sum"]
         return None
 
     @property
     def adblock_week(self) -> int | None:
         """Adblock week."""
-        for device in (
-            self.network.data.get("activity", {})
-            .get("network", {})
-            .get("adblock_week", [])
+        if device := self.network.get_activity(
+            "network", "adblock_week", self.url_insights
         ):
-            if device["insights_url"] == self.url_insights:
-                return device["sum"]
+            return device["sum"]
         return None
 
     @property
     def blocked_day(self) -> int | None:
         """Blocked day."""
-        for device in (
-            self.network.data.get("activity", {})
-            .get("network", {})
-            .get("blocked_day", [])
+        if device := self.network.get_activity(
+            "network", "blocked_day", self.url_insights
         ):
-            if device["insights_url"] == self.url_insights:
-                return device["sum"]
+            return device["sum"]
         return None
 
     @property
     def blocked_month(self) -> int | None:
         """Blocked month."""
-        for device in (
-            self.network.data.get("activity", {})
-            .get("network", {})
-            .get("blocked_month", [])
+        if device := self.network.get_activity(
+            "network", "blocked_month", self.url_insights
         ):
-            if device["insights_url"] == self.url_insights:
-                return device["sum"]
+            return device["sum"]
         return None
 
     @property
     def blocked_week(self) -> int | None:
         """Blocked week."""
-        for device in (
-            self.network.data.get("activity", {})
-            .get("network", {})
-            .get("blocked_week", [])
+        if device := self.network.get_activity(
+            "network", "blocked_week", self.url_insights
         ):
-            if device["insights_url"] == self.url_insights:
-                return device["sum"]
+            return device["sum"]
         return None
 
     @property
@@ -122,37 +105,22 @@ class EeroClient(EeroResource):
     @property
     def data_usage_day(self) -> tuple[int | None, int | None]:
         """Data usage day."""
-        for device in (
-            self.network.data.get("activity", {})
-            .get("devices", {})
-            .get("data_usage_day", [])
-        ):
-            if device["url"] == self.url:
-                return (device["download"], device["upload"])
+        if device := self.network.get_activity("devices", "data_usage_day", self.url):
+            return (device["download"], device["upload"])
         return (None, None)
 
     @property
     def data_usage_month(self) -> tuple[int | None, int | None]:
         """Data usage month."""
-        for device in (
-            self.network.data.get("activity", {})
-            .get("devices", {})
-            .get("data_usage_month", [])
-        ):
-            if device["url"] == self.url:
-                return (device["download"], device["upload"])
+        if device := self.network.get_activity("devices", "data_usage_month", self.url):
+            return (device["download"], device["upload"])
         return (None, None)
 
     @property
     def data_usage_week(self) -> tuple[int | None, int | None]:
         """Data usage week."""
-        for device in (
-            self.network.data.get("activity", {})
-            .get("devices", {})
-            .get("data_usage_week", [])
-        ):
-            if device["url"] == self.url:
-                return (device["download"], device["upload"])
+        if device := self.network.get_activity("devices", "data_usage_week", self.url):
+            return (device["download"], device["upload"])
         return (None, None)
 
     @property
@@ -170,40 +138,39 @@ class EeroClient(EeroResource):
         """Hostname."""
         return self.data.get("hostname")
 
+    @property
+    def fingerprint_data(self) -> list[Any]:
+        """Fingerprint data."""
+        return [
+            *super().fingerprint_data,
+            self.network.activity_entries(self.url, self.url_insights),
+        ]
+
     @property
     def inspected_day(self) -> int | None:
         """Inspected day."""
-        for device in (
-            self.network.data.get("activity", {})
-            .get("devices", {})
-            .get("inspected_day", [])
+        if device := self.network.get_activity(
+            "devices", "inspected_day", self.url_insights
         ):
-            if device["insights_url"] == self.url_insights:
-                return device["sum"]
+            return device["sum"]
         return None
 
     @property
     def inspected_month(self) -> int | None:
         """Inspected month."""
-        for device in (
-            self.network.data.get("activity", {})
-            .get("devices", {})
-            .get("inspected_month", [])
+        if device := self.network.get_activity(
+            "devices", "inspected_month", self.url_insights
         ):
-            if device["insights_url"] == self.url_insights:
-                return device["sum"]
+            return device["sum"]
         return None
 
     @property
     def inspected_week(self) -> int | None:
         """Inspected week."""
-        for device in (
-            self.network.data.get("activity", {})
-            .get("devices", {})
-            .get("inspected_week", [])
+        if device := self.network.get_activity(
+            "devices", "inspected_week", self.url_insights
         ):
-            if device["insights_url"] == self.url_insights:
-                return device["sum"]
+            return device["sum"]
         return None
 
     @property
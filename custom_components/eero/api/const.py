@@ -25,6 +25,24 @@ METHOD_PUT = "PUT"
 CADENCE_DAILY = "daily"
 CADENCE_HOURLY = "hourly"
 
+CHANGE_CLIENT_CONNECTED = "client_connected"
+CHANGE_CLIENT_DISCONNECTED = "client_disconnected"
+CHANGE_CLIENT_MOVED = "client_moved"
+CHANGE_EERO_FIRMWARE = "firmware_changed"
+CHANGE_EERO_STATUS = "status_changed"
+
+DATA_CLASS_ACTIVITY = "activity"
+DATA_CLASS_NETWORK = "network"
+DATA_CLASS_PRESENCE = "presence"
+DATA_CLASS_STATIC = "static"
+
+DEFAULT_MAX_CONCURRENT_ACTIVITY_REQUESTS = 3
+DEFAULT_MAX_CONCURRENT_REQUESTS = 5
+DEFAULT_QR_CODE_CACHE_SIZE = 32
+DEFAULT_RECORDER_QUEUE_SIZE = 100
+DEFAULT_RECORDER_SNAPSHOTS = 5
+DEFAULT_RELEASE_NOTES_TTL = 86400
+
 DEVICE_CATEGORY_COMPUTERS_PERSONAL = "computers_personal"
 DEVICE_CATEGORY_ENTERTAINMENT = "entertainment"
 DEVICE_CATEGORY_HOME = "home"
@@ -126,14 +144,27 @@ INSIGHT_TYPE_ADBLOCK = "adblock"
 INSIGHT_TYPE_BLOCKED = "blocked"
 INSIGHT_TYPE_INSPECTED = "inspected"
 
+LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
 MODEL_BEACON = "eero Beacon"
 
 PERIOD_DAY = "day"
 PERIOD_MONTH = "month"
 PERIOD_WEEK = "week"
 
+QR_CODE_AUTH_NOPASS = "nopass"
+QR_CODE_AUTH_WPA = "WPA/WPA2"
+QR_CODE_DEFAULT = "default"
+
+REFRESH_INTERVAL_TOLERANCE = 2
+
 RESOURCE_MAP = {"clients": "devices"}
 
+STAGE_ACCOUNT = "account"
+STAGE_NETWORK = "network"
+STAGE_PRESENCE = "presence"
+STAGE_UPDATE = "update"
+
 STATE_ACTIVE = "active"
 STATE_AMBIENT = "ambient"
 STATE_DISABLED = "disabled"
@@ -210,6 +241,13 @@ ACTIVITY_MAP = {
     ],
 }
 
+DATA_CLASS_MAP = {
+    DATA_CLASS_ACTIVITY: ["activity"],
+    DATA_CLASS_NETWORK: [],
+    DATA_CLASS_PRESENCE: ["devices", "profiles"],
+    DATA_CLASS_STATIC: ["backup_access_points", "release_notes", "thread"],
+}
+
 PREFERRED_UPDATE_HOUR_MAP = {
     "12am_1am": 0,
     "1am_2am": 1,
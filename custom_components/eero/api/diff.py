@@ -0,0 +1,169 @@
+"""Eero API."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from .client import EeroClient
+from .const import (
+    CHANGE_CLIENT_CONNECTED,
+    CHANGE_CLIENT_DISCONNECTED,
+    CHANGE_CLIENT_MOVED,
+    CHANGE_EERO_FIRMWARE,
+    CHANGE_EERO_STATUS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def client_states(devices: dict[str, Any]) -> dict[str, tuple[bool | None, str | None]]:
+    """Connected flag and source location of every client, keyed by URL."""
+    return {
+        client["url"]: (
+            client.get("connected"),
+            client.get("source", {}).get("location"),
+        )
+        for client in devices.get("data", [])
+        if client.get("url")
+    }
+
+
+def eero_states(eeros: dict[str, Any]) -> dict[str, tuple[str | None, str | None]]:
+    """Status and OS version of every eero, keyed by URL."""
+    return {
+        eero["url"]: (eero.get("status"), eero.get("os_version"))
+        for eero in eeros.get("data", [])
+        if eero.get("url")
+    }
+
+
+def changed_keys(previous: dict[str, Any], current: dict[str, Any]) -> set[str]:
+    """Keys whose value was added, removed or changed."""
+    return {key for key, _ in previous.items() ^ current.items()}
+
+
+class EeroChange:
+    """EeroChange."""
+
+    def __init__(
+        self,
+        change_type: str,
+        network,
+        resource,
+        previous: Any = None,
+        current: Any = None,
+    ) -> None:
+        """Initialize."""
+        self.change_type = change_type
+        self.current = current
+        self.network = network
+        self.previous = previous
+        self.resource = resource
+
+    def as_dict(self) -> dict[str, Any]:
+        """As dict."""
+        data = {
+            "network_id": self.network.id,
+            "network_name": self.network.name,
+            "id": self.resource.id,
+            "name": self.resource.name,
+            "previous": self.previous,
+            "current": self.current,
+        }
+        if self.resource.is_client:
+            data.update(
+                {
+                    "ip": self.resource.ip,
+                    "mac_address": self.resource.mac,
+                }
+            )
+        else:
+            data["mac_address"] = self.resource.mac_address
+        return data
+
+
+def diff_networks(previous, current) -> list[EeroChange]:
+    """Changes between two snapshots of a network.
+
+    Resources are keyed by URL and only those whose state differs get a
+    wrapper, so the cost beyond the keyed comparison is per change. Data a
+    tiered update carried over unchanged is skipped by identity.
+    """
+    changes = []
+
+    previous_devices = previous.data.get("devices", {})
+    current_devices = current.data.get("devices", {})
+    if previous_devices is not current_devices:
+        previous_clients = client_states(previous_devices)
+        current_clients = client_states(current_devices)
+        clients = {client["url"]: client for client in current_devices.get("data", [])}
+        removed = {
+            client["url"]: client
+            for client in previous_devices.get("data", [])
+            if client.get("url") and client["url"] not in clients
+        }
+
+        for url in sorted(changed_keys(previous_clients, current_clients)):
+            was_connected, was_location = previous_clients.get(url, (None, None))
+            connected, location = current_clients.get(url, (None, None))
+            if url in clients:
+                client = EeroClient(current.api, current, clients[url])
+            else:
+                client = EeroClient(previous.api, previous, removed[url])
+            if connected and not was_connected:
+                changes.append(
+                    EeroChange(CHANGE_CLIENT_CONNECTED, current, client, None, location)
+                )
+            elif was_connected and not connected:
+                changes.append(
+                    EeroChange(
+                        CHANGE_CLIENT_DISCONNECTED, current, client, was_location, None
+                    )
+                )
+            elif connected and location != was_location:
+                changes.append(
+                    EeroChange(
+                        CHANGE_CLIENT_MOVED, current, client, was_location, location
+                    )
+                )
+
+    previous_eeros = previous.data.get("eeros", {})
+    current_eeros = current.data.get("eeros", {})
+    if previous_eeros is not current_eeros:
+        previous_states = eero_states(previous_eeros)
+        current_states = eero_states(current_eeros)
+        eeros = {eero.url: eero for eero in current.eeros}
+        for url in sorted(changed_keys(previous_states, current_states)):
+            if url not in previous_states or url not in eeros:
+                continue
+            was_status, was_version = previous_states[url]
+            status, version = current_states[url]
+            if status != was_status:
+                changes.append(
+                    EeroChange(
+                        CHANGE_EERO_STATUS, current, eeros[url], was_status, status
+                    )
+                )
+            if version != was_version:
+                changes.append(
+                    EeroChange(
+                        CHANGE_EERO_FIRMWARE, current, eeros[url], was_version, version
+                    )
+                )
+
+    return changes
+
+
+def diff_accounts(previous, current) -> list[EeroChange]:
+    """Changes between two account snapshots, for networks present in both."""
+    if previous is None or previous is current:
+        return []
+    previous_networks = {network.url: network for network in previous.networks}
+    changes = []
+    for network in current.networks:
+        if network.url in previous_networks:
+            changes.extend(diff_networks(previous_networks[network.url], network))
+    if changes:
+        _LOGGER.debug("Found %s changes between snapshots", len(changes))
+    return changes
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from datetime import time
+from functools import cached_property
+from typing import Any
 
 from .const import (
     METHOD_POST,
@@ -23,14 +25,13 @@ class EeroDevice(EeroResource):
         """Connected clients counts."""
         return self.data.get("connected_clients_count")
 
-    @property
+    @cached_property
     def connected_clients_names(self) -> list[str]:
         """Connected clients names."""
-        return [
+        return sorted(
             client.name
-            for client in self.network.clients
-            if client.source_location == self.name
-        ]
+            for client in self.network.clients_by_source_location.get(self.name, [])
+        )
 
     @property
     def current_firmware(self) -> EeroFirmware:
@@ -43,39 +44,34 @@ class EeroDevice(EeroResource):
     @property
     def data_usage_day(self) -> tuple[int | None, int | None]:
         """Data usage day."""
-        for eero in (
-            self.network.data.get("activity", {})
-            .get("eeros", {})
-            .get("data_usage_day", [])
-        ):
-            if eero["url"] == self.url:
-                return (eero["download"], eero["upload"])
+        if eero := self.network.get_activity("eeros", "data_usage_day", self.url):
+            return (eero["download"], eero["upload"])
         return (None, None)
 
     @property
     def data_usage_month(self) -> tuple[int | None, int | None]:
         """Data usage month."""
-        for eero in (
-            self.network.data.get("activity", {})
-            .get("eeros", {})
-            .get("data_usage_month", [])
-        ):
-            if eero["url"] == self.url:
-                return (eero["download"], eero["upload"])
+        if eero := self.network.get_activity("eeros", "data_usage_month", self.url):
+            return (eero["download"], eero["upload"])
         return (None, None)
 
     @property
     def data_usage_week(self) -> tuple[int | None, int | None]:
         """Data usage week."""
-        for eero in (
-            self.network.data.get("activity", {})
-            .get("eeros", {})
-            .get("data_usage_week", [])
-        ):
-            if eero["url"] == self.url:
-                return (eero["download"], eero["upload"])
+        if eero := self.network.get_activity("eeros", "data_usage_week", self.url):
+            return (eero["download"], eero["upload"])
         return (None, None)
 
+    @property
+    def fingerprint_data(self) -> list[Any]:
+        """Fingerprint data."""
+        return [
+            *super().fingerprint_data,
+            self.connected_clients_names,
+            self.network.data.get("updates", {}),
+            self.network.activity_entries(self.url),
+        ]
+
     @property
     def is_gateway(self) -> bool | None:
         """Is gateway."""
@@ -0,0 +1,229 @@
+"""Eero API."""
+
+from __future__ import annotations
+
+import bisect
+import re
+from typing import Any
+from urllib.parse import urlsplit
+
+from .const import LATENCY_BUCKETS
+
+ID_PATTERN = re.compile(
+    r"\d+|[0-9a-f]{12}|(?:[0-9a-f]{2}:){5}[0-9a-f]{2}|[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12}",
+    re.IGNORECASE,
+)
+
+
+def endpoint_template(method: str | None, url: str | None) -> str:
+    """Endpoint template, with resource IDs replaced by `{id}`."""
+    parts = urlsplit(url or "")
+    path = "/".join(
+        "{id}" if ID_PATTERN.fullmatch(segment) else segment
+        for segment in parts.path.split("/")
+    )
+    return f"{method} {parts.netloc}{path}" if method else f"{parts.netloc}{path}"
+
+
+class EeroEndpointMetrics:
+    """EeroEndpointMetrics."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_last: float | None = None
+        self.latency_max = 0.0
+        self.latency_total = 0.0
+        self.payload_bytes = 0
+        self.payload_last: int | None = None
+
+    @property
+    def latency_mean(self) -> float | None:
+        """Latency mean."""
+        if self.count:
+            return self.latency_total / self.count
+        return None
+
+    def record(self, latency: float, size: int | None, error: bool) -> None:
+        """Record a request."""
+        self.count += 1
+        self.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.latency_last = latency
+        self.latency_max = max(self.latency_max, latency)
+        self.latency_total += latency
+        if size is not None:
+            self.payload_bytes += size
+            self.payload_last = size
+        if error:
+            self.errors += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """As dict."""
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "latency_histogram": {
+                f"le_{bound}": count
+                for bound, count in zip(
+                    [*LATENCY_BUCKETS, "inf"], self.latency_buckets, strict=True
+                )
+            },
+            "latency_last": self.latency_last,
+            "latency_max": self.latency_max,
+            "latency_mean": self.latency_mean,
+            "payload_bytes": self.payload_bytes,
+            "payload_last": self.payload_last,
+        }
+
+
+class EeroStageMetrics:
+    """EeroStageMetrics."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.count = 0
+        self.last: float | None = None
+        self.max = 0.0
+        self.total = 0.0
+
+    def record(self, duration: float) -> None:
+        """Record a stage duration."""
+        self.count += 1
+        self.last = duration
+        self.max = max(self.max, duration)
+        self.total += duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """As dict."""
+        return {
+            "count": self.count,
+            "last": self.last,
+            "max": self.max,
+            "mean": self.total / self.count if self.count else None,
+        }
+
+
+class EeroMetrics:
+    """EeroMetrics."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.endpoints: dict[str, EeroEndpointMetrics] = {}
+        self.entity_writes = 0
+        self.entity_writes_skipped = 0
+        self.network_stages: dict[str, dict[str, EeroStageMetrics]] = {}
+        self.session_refreshes = 0
+        self.stages: dict[str, EeroStageMetrics] = {}
+
+    def endpoint(self, method: str | None, url: str | None) -> EeroEndpointMetrics:
+        """Endpoint metrics for a request."""
+        template = endpoint_template(method, url)
+        if template not in self.endpoints:
+            self.endpoints[template] = EeroEndpointMetrics()
+        return self.endpoints[template]
+
+    def record_request(
+        self,
+        method: str | None,
+        url: str | None,
+        latency: float,
+        size: int | None = None,
+        error: bool = False,
+    ) -> None:
+        """Record a request."""
+        self.endpoint(method, url).record(latency=latency, size=size, error=error)
+
+    def record_entity_write(self, skipped: bool) -> None:
+        """Record an entity state write, or one skipped as unchanged."""
+        if skipped:
+            self.entity_writes_skipped += 1
+        else:
+            self.entity_writes += 1
+
+    def record_retry(self, method: str | None, url: str | None) -> None:
+        """Record a retried request."""
+        self.endpoint(method, url).retries += 1
+
+    def record_session_refresh(self) -> None:
+        """Record a session refresh."""
+        self.session_refreshes += 1
+
+    def record_stage(
+        self, stage: str, duration: float, network_id: str | None = None
+    ) -> None:
+        """Record an update stage duration, account wide or for a network."""
+        stages = self.stages_for(network_id)
+        if stage not in stages:
+            stages[stage] = EeroStageMetrics()
+        stages[stage].record(duration)
+
+    def stages_for(self, network_id: str | None = None) -> dict[str, EeroStageMetrics]:
+        """Stages, account wide or for a network."""
+        if network_id is None:
+            return self.stages
+        return self.network_stages.setdefault(network_id, {})
+
+    @property
+    def error_count(self) -> int:
+        """Error count."""
+        return sum(endpoint.errors for endpoint in self.endpoints.values())
+
+    @property
+    def request_count(self) -> int:
+        """Request count."""
+        return sum(endpoint.count for endpoint in self.endpoints.values())
+
+    @property
+    def retry_count(self) -> int:
+        """Retry count."""
+        return sum(endpoint.retries for endpoint in self.endpoints.values())
+
+    @property
+    def slowest_endpoint(self) -> tuple[str | None, float | None]:
+        """Endpoint with the slowest most recent request, and its latency."""
+        slowest = max(
+            (
+                (endpoint.latency_last, template)
+                for template, endpoint in self.endpoints.items()
+                if endpoint.latency_last is not None
+            ),
+            default=(None, None),
+        )
+        return (slowest[1], slowest[0])
+
+    def stage_durations(self, network_id: str | None = None) -> dict[str, float | None]:
+        """Most recent duration of every update stage, account wide or for a network."""
+        return {
+            stage: metrics.last
+            for stage, metrics in sorted(self.stages_for(network_id).items())
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """As dict."""
+        return {
+            "endpoints": {
+                template: endpoint.as_dict()
+                for template, endpoint in sorted(self.endpoints.items())
+            },
+            "entity_writes": self.entity_writes,
+            "entity_writes_skipped": self.entity_writes_skipped,
+            "errors": self.error_count,
+            "network_stages": {
+                network_id: {
+                    stage: metrics.as_dict()
+                    for stage, metrics in sorted(stages.items())
+                }
+                for network_id, stages in sorted(self.network_stages.items())
+            },
+            "requests": self.request_count,
+            "retries": self.retry_count,
+            "session_refreshes": self.session_refreshes,
+            "stages": {
+                stage: metrics.as_dict()
+                for stage, metrics in sorted(self.stages.items())
+            },
+        }
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from functools import cached_property
+from typing import Any
+
 from .backup_network import EeroBackupNetwork
 from .client import EeroClient
 from .const import (
@@ -14,6 +18,8 @@ from .const import (
     METHOD_PUT,
     MODEL_BEACON,
     PREFERRED_UPDATE_HOUR_MAP,
+    QR_CODE_DEFAULT,
+    STAGE_UPDATE,
     STATE_DISABLED,
     STATE_NETWORK,
     STATE_PROFILE,
@@ -22,7 +28,7 @@ from .eero import EeroDevice, EeroDeviceBeacon
 from .firmware import EeroFirmware
 from .profile import EeroProfile
 from .resource import EeroResource
-from .util import generate_qr_code, premium_ok
+from .util import premium_ok, qr_code_key
 
 
 class EeroNetwork(EeroResource):
@@ -112,6 +118,21 @@ class EeroNetwork(EeroResource):
                 return series["sum"]
         return None
 
+    @property
+    def api_error_count(self) -> int:
+        """API error count."""
+        return self.api.metrics.error_count
+
+    @property
+    def api_request_count(self) -> int:
+        """API request count."""
+        return self.api.metrics.request_count
+
+    @property
+    def api_slowest_endpoint(self) -> tuple[str | None, float | None]:
+        """API slowest endpoint."""
+        return self.api.metrics.slowest_endpoint
+
     @property
     def backup_internet_enabled(self) -> bool | None:
         """Backup internet enabled."""
@@ -237,111 +258,63 @@ class EeroNetwork(EeroResource):
     @property
     def connected_clients_count(self) -> int:
         """Connected clients count."""
-        return len([client for client in self.clients if client.connected])
+        return self.count_clients(connected=True)
 
     @property
     def connected_clients_count_computers_personal(self) -> int:
         """Connected clients count computers personal."""
-        return len(
-            [
-                client
-                for client in self.clients
-                if client.connected
-                and client.device_category == DEVICE_CATEGORY_COMPUTERS_PERSONAL
-            ]
+        return self.count_clients(
+            connected=True, category=DEVICE_CATEGORY_COMPUTERS_PERSONAL
         )
 
     @property
     def connected_clients_count_entertainment(self) -> int:
         """Connected clients count entertainment."""
-        return len(
-            [
-                client
-                for client in self.clients
-                if client.connected
-                and client.device_category == DEVICE_CATEGORY_ENTERTAINMENT
-            ]
+        return self.count_clients(
+            connected=True, category=DEVICE_CATEGORY_ENTERTAINMENT
         )
 
     @property
     def connected_clients_count_home(self) -> int:
         """Connected clients count home."""
-        return len(
-            [
-                client
-                for client in self.clients
-                if client.connected and client.device_category == DEVICE_CATEGORY_HOME
-            ]
-        )
+        return self.count_clients(connected=True, category=DEVICE_CATEGORY_HOME)
 
     @property
     def connected_clients_count_other(self) -> int:
         """Connected clients count other."""
-        return len(
-            [
-                client
-                for client in self.clients
-                if client.connected and client.device_category == DEVICE_CATEGORY_OTHER
-            ]
-        )
+        return self.count_clients(connected=True, category=DEVICE_CATEGORY_OTHER)
 
     @property
     def connected_guest_clients_count(self) -> int:
         """Connected guest clients count."""
-        return len(
-            [client for client in self.clients if client.connected and client.is_guest]
-        )
+        return self.count_clients(connected=True, guest=True)
 
     @property
     def connected_guest_clients_count_computers_personal(self) -> int:
         """Connected guest clients count computers personal."""
-        return len(
-            [
-                client
-                for client in self.clients
-                if client.connected
-                and client.is_guest
-                and client.device_category == DEVICE_CATEGORY_COMPUTERS_PERSONAL
-            ]
+        return self.count_clients(
+            connected=True, guest=True, category=DEVICE_CATEGORY_COMPUTERS_PERSONAL
         )
 
     @property
     def connected_guest_clients_count_entertainment(self) -> int:
         """Connected guest clients count entertainment."""
-        return len(
-            [
-                client
-                for client in self.clients
-                if client.connected
-                and client.is_guest
-                and client.device_category == DEVICE_CATEGORY_ENTERTAINMENT
-            ]
+        return self.count_clients(
+            connected=True, guest=True, category=DEVICE_CATEGORY_ENTERTAINMENT
         )
 
     @property
     def connected_guest_clients_count_home(self) -> int:
         """Connected guest clients count home."""
-        return len(
-            [
-                client
-                for client in self.clients
-                if client.connected
-                and client.is_guest
-                and client.device_category == DEVICE_CATEGORY_HOME
-            ]
+        return self.count_clients(
+            connected=True, guest=True, category=DEVICE_CATEGORY_HOME
         )
 
     @property
     def connected_guest_clients_count_other(self) -> int:
         """Connected guest clients count other."""
-        return len(
-            [
-                client
-                for client in self.clients
-                if client.connected
-                and client.is_guest
-                and client.device_category == DEVICE_CATEGORY_OTHER
-            ]
+        return self.count_clients(
+            connected=True, guest=True, category=DEVICE_CATEGORY_OTHER
         )
 
     @property
@@ -430,6 +403,11 @@ class EeroNetwork(EeroResource):
             },
         )
 
+    @property
+    def entity_writes_skipped(self) -> int:
+        """Entity writes skipped."""
+        return self.api.metrics.entity_writes_skipped
+
     @property
     def firmware_history(self) -> list[EeroFirmware | None]:
         """Firmware history."""
@@ -491,14 +469,19 @@ class EeroNetwork(EeroResource):
     @property
     def guest_network_qr_code(self) -> bytes | None:
         """Guest network QR code."""
+        return self.api.qr_code(self.guest_network_qr_code_key)
+
+    @property
+    def guest_network_qr_code_key(self) -> tuple[str, str | None, str] | str | None:
+        """Guest network QR code key."""
         if all(
             [
                 not self.guest_network_enabled,
                 self.api.show_eero_logo.get(self.id),
             ]
         ):
-            return self.api.default_qr_code
-        return generate_qr_code(
+            return QR_CODE_DEFAULT
+        return qr_code_key(
             ssid=self.guest_network_name,
             password=self.guest_network_password,
         )
@@ -684,7 +667,12 @@ class EeroNetwork(EeroResource):
     @property
     def qr_code(self) -> bytes | None:
         """QR code."""
-        return generate_qr_code(
+        return self.api.qr_code(self.qr_code_key)
+
+    @property
+    def qr_code_key(self) -> tuple[str, str | None, str] | None:
+        """QR code key."""
+        return qr_code_key(
             ssid=self.ssid,
             password=self.password,
         )
@@ -825,6 +813,13 @@ class EeroNetwork(EeroResource):
         """Update."""
         self.api.call(method=METHOD_POST, url=self.url_updates)
 
+    @property
+    def update_duration(self) -> float | None:
+        """Update duration."""
+        if stage := self.api.metrics.stages_for(self.id).get(STAGE_UPDATE):
+            return stage.last
+        return None
+
     @property
     def upnp(self) -> bool | None:
         """UPNP."""
@@ -899,7 +894,7 @@ class EeroNetwork(EeroResource):
             },
         )
 
-    @property
+    @cached_property
     def backup_networks(self) -> list[EeroBackupNetwork | None]:
         """Backup networks."""
         return [
@@ -909,7 +904,7 @@ class EeroNetwork(EeroResource):
             )
         ]
 
-    @property
+    @cached_property
     def clients(self) -> list[EeroClient | None]:
         """Clients."""
         return [
@@ -917,7 +912,7 @@ class EeroNetwork(EeroResource):
             for client in self.data.get("devices", {}).get("data", [])
         ]
 
-    @property
+    @cached_property
     def eeros(self) -> list[EeroDevice | EeroDeviceBeacon | None]:
         """Eeros."""
         eeros = []
@@ -928,7 +923,7 @@ class EeroNetwork(EeroResource):
                 eeros.append(EeroDevice(self.api, self, eero))
         return eeros
 
-    @property
+    @cached_property
     def profiles(self) -> list[EeroProfile | None]:
         """Profiles."""
         return [
@@ -936,7 +931,7 @@ class EeroNetwork(EeroResource):
             for profile in self.data.get("profiles", {}).get("data", [])
         ]
 
-    @property
+    @cached_property
     def resources(
         self,
     ) -> list[
@@ -949,3 +944,117 @@ class EeroNetwork(EeroResource):
     ]:
         """Resources."""
         return self.backup_networks + self.eeros + self.profiles + self.clients
+
+    def get_resource(
+        self, resource_id: str
+    ) -> (
+        EeroBackupNetwork
+        | EeroClient
+        | EeroDevice
+        | EeroDeviceBeacon
+        | EeroProfile
+        | None
+    ):
+        """Get resource."""
+        return self.resource_map.get(resource_id)
+
+    @cached_property
+    def resource_map(
+        self,
+    ) -> dict[
+        str,
+        EeroBackupNetwork | EeroClient | EeroDevice | EeroDeviceBeacon | EeroProfile,
+    ]:
+        """Resource map."""
+        resource_map = {}
+        for resource in self.resources:
+            resource_map.setdefault(resource.id, resource)
+        return resource_map
+
+    @cached_property
+    def clients_by_source_location(self) -> dict[str | None, list[EeroClient]]:
+        """Clients by source location."""
+        clients_by_source_location = {}
+        for client in self.clients:
+            clients_by_source_location.setdefault(client.source_location, []).append(
+                client
+            )
+        return clients_by_source_location
+
+    @cached_property
+    def client_counts(self) -> Counter[tuple[bool, bool, bool, str | None]]:
+        """Client counts."""
+        return Counter(
+            (
+                bool(client.connected),
+                bool(client.is_guest),
+                bool(client.wireless),
+                client.device_category,
+            )
+            for client in self.clients
+        )
+
+    def count_clients(
+        self,
+        connected: bool | None = None,
+        guest: bool | None = None,
+        wireless: bool | None = None,
+        category: str | None = None,
+    ) -> int:
+        """Count clients."""
+        return sum(
+            count
+            for (
+                client_connected,
+                client_guest,
+                client_wireless,
+                client_category,
+            ), count in self.client_counts.items()
+            if all(
+                [
+                    connected is None or client_connected == connected,
+                    guest is None or client_guest == guest,
+                    wireless is None or client_wireless == wireless,
+                    category is None or client_category == category,
+                ]
+            )
+        )
+
+    @cached_property
+    def activity_map(self) -> dict[str, dict[str, dict[str, dict[str, Any]]]]:
+        """Activity map."""
+        activity_map = {}
+        for resource, activities in self.data.get("activity", {}).items():
+            activity_map[resource] = {}
+            for activity, data in activities.items():
+                activity_map[resource][activity] = {}
+                for series in data.values() if isinstance(data, dict) else [data]:
+                    for entry in series or []:
+                        if not isinstance(entry, dict):
+                            continue
+                        for key in ["url", "insights_url"]:
+                            if entry.get(key) is not None:
+                                activity_map[resource][activity].setdefault(
+                                    entry[key], entry
+                                )
+        return activity_map
+
+    @cached_property
+    def activity_urls(self) -> dict[str, list[dict[str, Any]]]:
+        """Activity entries by URL, across every resource and activity."""
+        activity_urls = {}
+        for activities in self.activity_map.values():
+            for entries in activities.values():
+                for url, entry in entries.items():
+                    activity_urls.setdefault(url, []).append(entry)
+        return activity_urls
+
+    def activity_entries(self, *urls: str | None) -> list[dict[str, Any]]:
+        """Activity entries for any of the URLs, across every activity."""
+        return [entry for url in urls for entry in self.activity_urls.get(url, [])]
+
+    def get_activity(
+        self, resource: str, activity: str, url: str | None
+    ) -> dict[str, Any] | None:
+        """Get activity."""
+        return self.activity_map.get(resource, {}).get(activity, {}).get(url)
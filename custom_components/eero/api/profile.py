@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import cached_property
+from typing import Any
 
 from .client import EeroClient
 from .const import METHOD_POST, METHOD_PUT
@@ -45,37 +47,28 @@ class EeroProfile(EeroResource):
     @property
     def adblock_day(self) -> int | None:
         """Adblock day."""
-        for profile in (
-            self.network.data.get("activity", {})
-            .get("profiles", {})
-            .get("adblock_day", [])
+        if profile := self.network.get_activity(
+            "profiles", "adblock_day", self.url_insights
         ):
-            if profile["insights_url"] == self.url_insights:
-                return profile["sum"]
+            return profile["sum"]
         return None
 
     @property
     def adblock_month(self) -> int | None:
         """Adblock month."""
-        for profile in (
-            self.network.data.get("activity", {})
-            .get("profiles", {})
-            .get("adblock_month", [])
+        if profile := self.network.get_activity(
+            "profiles", "adblock_month", self.url_insights
         ):
-            if profile["insights_url"] == self.url_insights:
-                return profile["sum"]
+            return profile["sum"]
         return None
 
     @property
     def adblock_week(self) -> int | None:
         """Adblock week."""
-        for profile in (
-            self.network.data.get("activity", {})
-            .get("profiles", {})
-            .get("adblock_week", [])
+        if profile := self.network.get_activity(
+            "profiles", "adblock_week", self.url_insights
         ):
-            if profile["insights_url"] == self.url_insights:
-                return profile["sum"]
+            return profile["sum"]
         return None
 
     @property
@@ -276,37 +269,28 @@ class EeroProfile(EeroResource):
     @property
     def blocked_day(self) -> int | None:
         """Blocked day."""
-        for profile in (
-            self.network.data.get("activity", {})
-            .get("profiles", {})
-            .get("blocked_day", [])
+        if profile := self.network.get_activity(
+            "profiles", "blocked_day", self.url_insights
         ):
-            if profile["insights_url"] == self.url_insights:
-                return profile["sum"]
+            return profile["sum"]
         return None
 
     @property
     def blocked_month(self) -> int | None:
         """Blocked month."""
-        for profile in (
-            self.network.data.get("activity", {})
-            .get("profiles", {})
-            .get("blocked_month", [])
+        if profile := self.network.get_activity(
+            "profiles", "blocked_month", self.url_insights
         ):
-            if profile["insights_url"] == self.url_insights:
-                return profile["sum"]
+            return profile["sum"]
         return None
 
     @property
     def blocked_week(self) -> int | None:
         """Blocked week."""
-        for profile in (
-            self.network.data.get("activity", {})
-            .get("profiles", {})
-            .get("blocked_week", [])
+        if profile := self.network.get_activity(
+            "profiles", "blocked_week", self.url_insights
         ):
-            if profile["insights_url"] == self.url_insights:
-                return profile["sum"]
+            return profile["sum"]
         return None
 
     @property
@@ -319,10 +303,10 @@ class EeroProfile(EeroResource):
         """Connected clients count."""
         return len(self.connected_clients_names)
 
-    @property
+    @cached_property
     def connected_clients_names(self) -> list[str]:
         """Connected clients names."""
-        return [client.name for client in self.clients if client.connected]
+        return sorted(client.name for client in self.clients if client.connected)
 
     @property
     def data_usage_day(self) -> tuple[int | None, int | None]:
@@ -372,43 +356,51 @@ class EeroProfile(EeroResource):
                 up = series["sum"]
         return (down, up)
 
+    @property
+    def fingerprint_data(self) -> list[Any]:
+        """Fingerprint data."""
+        return [
+            *super().fingerprint_data,
+            self.network.ad_block_enabled,
+            self.network.ad_block_profiles,
+            self.network.activity_entries(self.url_insights),
+            [
+                series.get(self.id)
+                for series in self.network.data.get("activity", {})
+                .get("profiles", {})
+                .values()
+                if isinstance(series, dict)
+            ],
+        ]
+
     @property
     def inspected_day(self) -> int | None:
         """Inspected day."""
-        for profile in (
-            self.network.data.get("activity", {})
-            .get("profiles", {})
-            .get("inspected_day", [])
+        if profile := self.network.get_activity(
+            "profiles", "inspected_day", self.url_insights
         ):
-            if profile["insights_url"] == self.url_insights:
-                return profile["sum"]
+            return profile["sum"]
         return None
 
     @property
     def inspected_month(self) -> int | None:
         """Inspected month."""
-        for profile in (
-            self.network.data.get("activity", {})
-            .get("profiles", {})
-            .get("inspected_month", [])
+        if profile := self.network.get_activity(
+            "profiles", "inspected_month", self.url_insights
         ):
-            if profile["insights_url"] == self.url_insights:
-                return profile["sum"]
+            return profile["sum"]
         return None
 
     @property
     def inspected_week(self) -> int | None:
         """Inspected week."""
-        for profile in (
-            self.network.data.get("activity", {})
-            .get("profiles", {})
-            .get("inspected_week", [])
+        if profile := self.network.get_activity(
+            "profiles", "inspected_week", self.url_insights
         ):
-            if profile["insights_url"] == self.url_insights:
-                return profile["sum"]
+            return profile["sum"]
         return None
 
-    @property
+    @cached_property
     def last_active(self) -> datetime | None:
         """Last active."""
         if last_active := [
@@ -498,7 +490,7 @@ class EeroProfile(EeroResource):
             },
         )
 
-    @property
+    @cached_property
     def clients(self) -> list[EeroClient | None]:
         """Clients."""
         return [
@@ -0,0 +1,213 @@
+"""Eero API."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+BACKUP_NETWORK_FIELDS = frozenset(
+    [
+        "connectivity",
+        "created",
+        "enabled",
+        "last_updated_at",
+        "password",
+        "ssid",
+        "uuid",
+    ]
+)
+
+CLIENT_FIELDS = frozenset(
+    [
+        "channel",
+        "connected",
+        "connection_type",
+        "connectivity",
+        "device_type",
+        "hostname",
+        "interface",
+        "ip",
+        "is_guest",
+        "is_private",
+        "last_active",
+        "mac",
+        "manufacturer",
+        "nickname",
+        "paused",
+        "secondary_wan_deny_access",
+        "source",
+        "url",
+        "usage",
+        "wireless",
+    ]
+)
+
+EERO_FIELDS = frozenset(
+    [
+        "connected_clients_count",
+        "gateway",
+        "led_brightness",
+        "led_on",
+        "location",
+        "mac_address",
+        "model",
+        "model_number",
+        "nightlight",
+        "os_version",
+        "resources",
+        "serial",
+        "status",
+        "update_available",
+        "update_status",
+        "url",
+    ]
+)
+
+NETWORK_FIELDS = frozenset(
+    [
+        "activity",
+        "backup_access_points",
+        "backup_internet_enabled",
+        "band_steering",
+        "capabilities",
+        "clients",
+        "ddns",
+        "devices",
+        "dns",
+        "eeros",
+        "gateway_ip",
+        "geo_ip",
+        "guest_network",
+        "health",
+        "ip_settings",
+        "ipv6_upstream",
+        "lease",
+        "name",
+        "nickname_label",
+        "password",
+        "premium_dns",
+        "premium_status",
+        "profiles",
+        "resources",
+        "speed",
+        "sqm",
+        "status",
+        "temporary_flags",
+        "thread",
+        "timezone",
+        "updates",
+        "upnp",
+        "url",
+        "wpa3",
+    ]
+)
+
+PROFILE_FIELDS = frozenset(
+    [
+        "devices",
+        "name",
+        "paused",
+        "premium_dns",
+        "unified_content_filters",
+        "url",
+    ]
+)
+
+
+def project(data: dict[str, Any], fields: frozenset[str]) -> dict[str, Any]:
+    """Keep only the given top level fields of a resource."""
+    return {key: value for key, value in data.items() if key in fields}
+
+
+def project_resources(
+    data: dict[str, Any] | None, fields: frozenset[str]
+) -> dict[str, Any] | None:
+    """Project every resource of a `{"count", "data"}` collection."""
+    if not isinstance(data, dict) or not isinstance(data.get("data"), list):
+        return data
+    return {
+        **data,
+        "data": [
+            project(resource, fields) if isinstance(resource, dict) else resource
+            for resource in data["data"]
+        ],
+    }
+
+
+def merge_presence(
+    devices: dict[str, Any] | None, update: dict[str, Any] | None
+) -> dict[str, Any] | None:
+    """Carry the connected flag and source of updated clients over to devices.
+
+    Clients whose presence is unchanged keep their dict, and the collection
+    itself is returned as is when no client changed. Clients only present in
+    one of the two are left to the next full update.
+    """
+    if not isinstance(devices, dict) or not isinstance(update, dict):
+        return devices
+    presence = {
+        client["url"]: client
+        for client in update.get("data") or []
+        if isinstance(client, dict) and client.get("url")
+    }
+    clients = []
+    for client in devices.get("data") or []:
+        current = presence.get(client.get("url")) if isinstance(client, dict) else None
+        if current and any(
+            [
+                current.get("connected") != client.get("connected"),
+                (current.get("source") or {}).get("location")
+                != (client.get("source") or {}).get("location"),
+            ]
+        ):
+            client = {
+                **client,
+                "connected": current.get("connected"),
+                "source": current.get("source"),
+            }
+        clients.append(client)
+    if all(
+        client is previous
+        for client, previous in zip(clients, devices.get("data") or [], strict=True)
+    ):
+        return devices
+    return {**devices, "data": clients}
+
+
+def project_network(data: dict[str, Any]) -> dict[str, Any]:
+    """Project a network and the resources nested in it."""
+    network = project(data, NETWORK_FIELDS)
+    for key, fields in [
+        ("backup_access_points", BACKUP_NETWORK_FIELDS),
+        ("devices", CLIENT_FIELDS),
+        ("eeros", EERO_FIELDS),
+        ("profiles", PROFILE_FIELDS),
+    ]:
+        if key in network:
+            network[key] = project_resources(network[key], fields)
+    if profiles := (network.get("profiles") or {}).get("data"):
+        network["profiles"]["data"] = [
+            {
+                **profile,
+                "devices": [
+                    project(client, CLIENT_FIELDS)
+                    for client in profile.get("devices") or []
+                ],
+            }
+            if isinstance(profile, dict) and "devices" in profile
+            else profile
+            for profile in profiles
+        ]
+    return network
+
+
+def retained_bytes(data: Any) -> int:
+    """Approximate number of bytes retained by decoded JSON data."""
+    size = sys.getsizeof(data)
+    if isinstance(data, dict):
+        size += sum(
+            retained_bytes(key) + retained_bytes(value) for key, value in data.items()
+        )
+    elif isinstance(data, list):
+        size += sum(retained_bytes(value) for value in data)
+    return size
@@ -0,0 +1,133 @@
+"""Eero API."""
+
+from __future__ import annotations
+
+import datetime
+import gzip
+import hashlib
+import json
+import logging
+from pathlib import Path
+import queue
+import threading
+from typing import Any
+
+from .const import DEFAULT_RECORDER_QUEUE_SIZE, DEFAULT_RECORDER_SNAPSHOTS
+from .util import json_dumps
+
+_LOGGER = logging.getLogger(__name__)
+
+RECORDING_SUFFIX = ".json.gz"
+
+
+def body_digest(body: Any) -> str | None:
+    """Body digest."""
+    if body is None:
+        return None
+    return hashlib.sha256(
+        json.dumps(body, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()[:16]
+
+
+def endpoint_name(name: str) -> str:
+    """Endpoint name."""
+    return name.strip("/").replace("/", "_").replace(".", "_") or "response"
+
+
+class EeroResponseRecorder:
+    """EeroResponseRecorder."""
+
+    def __init__(
+        self,
+        location: str,
+        snapshots: int = DEFAULT_RECORDER_SNAPSHOTS,
+        queue_size: int = DEFAULT_RECORDER_QUEUE_SIZE,
+    ) -> None:
+        """Initialize."""
+        self.location = Path(location)
+        self.snapshots = snapshots
+        self.dropped = 0
+        self.recorded = 0
+        self._queue: queue.Queue[tuple[str, dict[str, Any]] | None] = queue.Queue(
+            maxsize=queue_size
+        )
+        self._created = False
+        self._slots: dict[tuple[str, str | None], int] = {}
+        self._thread: threading.Thread | None = None
+
+    def record(
+        self,
+        name: str,
+        response: Any,
+        method: str | None = None,
+        url: str | None = None,
+        body: Any = None,
+    ) -> None:
+        """Queue a response for recording without blocking the caller.
+
+        The response is queued by reference and serialized in the recorder
+        thread, so callers must not mutate it afterwards.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="eero_response_recorder", daemon=True
+            )
+            self._thread.start()
+        name = endpoint_name(name)
+        try:
+            self._queue.put_nowait(
+                (
+                    name,
+                    {
+                        "body": body,
+                        "method": method,
+                        "recorded": datetime.datetime.now(datetime.UTC).isoformat(),
+                        "response": response,
+                        "url": url,
+                    },
+                )
+            )
+        except queue.Full:
+            self.dropped += 1
+            _LOGGER.debug("Response recorder queue full, dropping: %s", name)
+
+    def stop(self) -> None:
+        """Write queued responses and stop the recorder thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        """Run."""
+        while (item := self._queue.get()) is not None:
+            name, envelope = item
+            try:
+                self._write(name, envelope)
+            except (OSError, TypeError, ValueError) as exception:
+                _LOGGER.warning("Unable to record response: %s - %s", name, exception)
+
+    def _write(self, name: str, envelope: dict[str, Any]) -> None:
+        """Serialize a recording into the next slot of its endpoint ring.
+
+        Requests to the same endpoint with different bodies, such as activity
+        of another type or period, get a ring of their own.
+        """
+        digest = body_digest(envelope.pop("body"))
+        content = json_dumps({"body_digest": digest, **envelope})
+        if not self._created:
+            _LOGGER.debug("Creating directory: %s", self.location)
+            self.location.mkdir(parents=True, exist_ok=True)
+            self._created = True
+        slot = self._slots.get((name, digest), 0)
+        self._slots[(name, digest)] = (slot + 1) % self.snapshots
+        if digest:
+            name = f"{name}.{digest}"
+        path = self.location / f"{name}.{slot}{RECORDING_SUFFIX}"
+        temporary = path.with_name(f"{path.name}.tmp")
+        with gzip.open(temporary, mode="wb") as file:
+            file.write(content)
+        temporary.replace(path)
+        self.recorded += 1
+        _LOGGER.debug("Recorded response: %s", path)
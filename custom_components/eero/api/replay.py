@@ -0,0 +1,208 @@
+"""Eero API."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+from http import HTTPStatus
+import logging
+from pathlib import Path
+import time
+from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+
+from .const import METHOD_DELETE, METHOD_GET, METHOD_POST, METHOD_PUT
+from .recorder import RECORDING_SUFFIX, body_digest
+from .util import json_dumps, json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EeroReplayResponse:
+    """EeroReplayResponse.
+
+    Covers the parts of `requests.Response` and `aiohttp.ClientResponse`
+    that `EeroAPI` reads, including use as an async context manager.
+    """
+
+    def __init__(
+        self,
+        status: int,
+        content: bytes,
+        url: str,
+        latency: float = 0.0,
+    ) -> None:
+        """Initialize."""
+        self.status = status
+        self.content = content
+        self.headers: dict[str, str] = {}
+        self.latency = latency
+        self.url = url
+
+    async def __aenter__(self) -> EeroReplayResponse:
+        """Async enter."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Async exit."""
+
+    @property
+    def ok(self) -> bool:
+        """OK."""
+        return bool(self.status < 400)
+
+    @property
+    def reason(self) -> str:
+        """Reason."""
+        return HTTPStatus(self.status).phrase
+
+    @property
+    def status_code(self) -> int:
+        """Status code."""
+        return self.status
+
+    @property
+    def text(self) -> str:
+        """Text."""
+        return self.content.decode(errors="replace")
+
+    async def read(self) -> bytes:
+        """Read."""
+        return self.content
+
+
+class EeroReplayTransport:
+    """EeroReplayTransport.
+
+    Serves recorded responses, keyed by method, URL and request body digest,
+    from a directory written by `EeroResponseRecorder`. Requests without a
+    recording for their body get a 404 and are collected in `misses`.
+    """
+
+    def __init__(self, location: str, latency: float = 0.0) -> None:
+        """Initialize."""
+        self.latency = latency
+        self.location = Path(location)
+        self.misses: list[tuple[str, str]] = []
+        self.recordings: dict[tuple[str, str], dict[str | None, dict]] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Index every recording in the location, keeping the latest per key."""
+        for path in sorted(self.location.glob(f"*{RECORDING_SUFFIX}")):
+            with gzip.open(path, mode="rb") as file:
+                envelope = json_loads(file.read())
+            if not envelope.get("method") or not envelope.get("url"):
+                continue
+            recordings = self.recordings.setdefault(
+                (envelope["method"].upper(), envelope["url"]), {}
+            )
+            digest = envelope.get("body_digest")
+            if any(
+                [
+                    digest not in recordings,
+                    recordings.get(digest, {}).get("recorded", "")
+                    <= envelope["recorded"],
+                ]
+            ):
+                recordings[digest] = envelope
+        _LOGGER.debug(
+            "Loaded %s recorded endpoints from: %s", len(self.recordings), self.location
+        )
+
+    def lookup(self, method: str, url: str, body: Any = None) -> dict | None:
+        """Find the recording for a request with the same body."""
+        parts = urlsplit(url)
+        for key in [url, urlunsplit(("", "", parts.path, parts.query, ""))]:
+            if recordings := self.recordings.get((method.upper(), key)):
+                return recordings.get(body_digest(body))
+        return None
+
+    def respond(
+        self, method: str, url: str, json: Any = None, latency: float | None = None
+    ) -> EeroReplayResponse:
+        """Build the response for a request."""
+        if latency is None:
+            latency = self.latency
+        if (envelope := self.lookup(method, url, json)) is None:
+            _LOGGER.debug("No recorded response for: %s %s", method, url)
+            self.misses.append((method, url))
+            return EeroReplayResponse(
+                status=HTTPStatus.NOT_FOUND,
+                content=json_dumps(
+                    {"meta": {"code": HTTPStatus.NOT_FOUND, "error": "error.replay"}}
+                ),
+                url=url,
+                latency=latency,
+            )
+        response = envelope["response"]
+        if envelope["url"].startswith("/"):
+            response = {"meta": {"code": HTTPStatus.OK}, "data": response}
+        return EeroReplayResponse(
+            status=HTTPStatus.OK,
+            content=json_dumps(response),
+            url=url,
+            latency=latency,
+        )
+
+
+class EeroReplaySession:
+    """EeroReplaySession.
+
+    Stand-in for the `requests.Session` used by `EeroAPI.call`.
+    """
+
+    def __init__(self, transport: EeroReplayTransport) -> None:
+        """Initialize."""
+        self.transport = transport
+
+    def delete(self, url: str, **kwargs) -> EeroReplayResponse:
+        """Delete."""
+        return self.request(METHOD_DELETE, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> EeroReplayResponse:
+        """Get."""
+        return self.request(METHOD_GET, url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> EeroReplayResponse:
+        """Post."""
+        return self.request(METHOD_POST, url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> EeroReplayResponse:
+        """Put."""
+        return self.request(METHOD_PUT, url, **kwargs)
+
+    def request(
+        self, method: str, url: str, json: Any = None, **kwargs
+    ) -> EeroReplayResponse:
+        """Request."""
+        if self.transport.latency:
+            time.sleep(self.transport.latency)
+        return self.transport.respond(method=method, url=url, json=json, latency=0.0)
+
+
+class EeroReplayClientSession:
+    """EeroReplayClientSession.
+
+    Stand-in for the `aiohttp.ClientSession` used by `EeroAPI.async_call`.
+    """
+
+    def __init__(self, transport: EeroReplayTransport) -> None:
+        """Initialize."""
+        self.transport = transport
+
+    def get(self, url: str, **kwargs) -> EeroReplayResponse:
+        """Get."""
+        return self.request(METHOD_GET, url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> EeroReplayResponse:
+        """Post."""
+        return self.request(METHOD_POST, url, **kwargs)
+
+    def request(
+        self, method: str, url: str, json: Any = None, **kwargs
+    ) -> EeroReplayResponse:
+        """Request, used as `async with session.request(...)`."""
+        return self.transport.respond(method=method, url=url, json=json)
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+from functools import cached_property
+from typing import Any
+
 from .const import URL_ACCOUNT
+from .util import json_dumps
 
 
 class EeroResource:
@@ -14,6 +18,18 @@ class EeroResource:
         self.network = network
         self.data = data
 
+    @cached_property
+    def fingerprint(self) -> int:
+        """Fingerprint of the data the resource's state is derived from."""
+        return hash(json_dumps(self.fingerprint_data))
+
+    @property
+    def fingerprint_data(self) -> list[Any]:
+        """Fingerprint data."""
+        if self.network is None:
+            return [self.data]
+        return [self.network.name, self.data]
+
     @property
     def id(self) -> str | None:
         """ID."""
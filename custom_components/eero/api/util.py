@@ -3,10 +3,47 @@
 from __future__ import annotations
 
 import io
+import json
+from typing import Any
 
 import pyqrcode
 
-from .const import STATE_ACTIVE, STATE_TRIALING
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .const import (
+    QR_CODE_AUTH_NOPASS,
+    QR_CODE_AUTH_WPA,
+    STATE_ACTIVE,
+    STATE_TRIALING,
+)
+
+
+def json_dumps(data: Any) -> bytes:
+    """Encode JSON, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(data, default=lambda o: "not-serializable")
+    return json.dumps(data, default=lambda o: "not-serializable").encode()
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Decode JSON, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def qr_code_key(
+    ssid: str | None, password: str | None
+) -> tuple[str, str | None, str] | None:
+    """QR code key, identifying the rendered image."""
+    if ssid is None:
+        return None
+    if password:
+        return (ssid, password, QR_CODE_AUTH_WPA)
+    return (ssid, None, QR_CODE_AUTH_NOPASS)
 
 
 def generate_qr_code(ssid: str, password: str | None) -> bytes | None:
@@ -17,14 +54,14 @@ def generate_qr_code(ssid: str, password: str | None) -> bytes | None:
         wifi_code = "WIFI:S:{ssid};H:{hidden};T:{auth_type};P:{password};;".format(
             ssid=ssid,
             hidden="false",
-            auth_type="WPA/WPA2",
+            auth_type=QR_CODE_AUTH_WPA,
             password=password,
         )
     else:
         wifi_code = "WIFI:S:{ssid};H:{hidden};T:{auth_type};;".format(
             ssid=ssid,
             hidden="false",
-            auth_type="nopass",
+            auth_type=QR_CODE_AUTH_NOPASS,
         )
     qr_stream = io.BytesIO()
     qr_code = pyqrcode.create(wifi_code)
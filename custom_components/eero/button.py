@@ -115,4 +115,4 @@ class EeroButtonEntity(EeroEntity, ButtonEntity):
         """Press the button."""
         await super().async_press()
         if self.entity_description.request_refresh:
-            await self.coordinator.async_request_refresh()
+            await self.async_request_network_refresh()
@@ -37,12 +37,17 @@ from .const import (
     CONF_CONSIDER_HOME,
     CONF_EEROS,
     CONF_LOGIN,
+    CONF_MAX_CONCURRENT_REQUESTS,
     CONF_MISCELLANEOUS,
     CONF_NETWORKS,
     CONF_PREFIX_NETWORK_NAME,
     CONF_PROFILES,
     CONF_RESOURCES,
     CONF_SAVE_RESPONSES,
+    CONF_SCAN_INTERVAL_ACTIVITY,
+    CONF_SCAN_INTERVAL_PRESENCE,
+    CONF_SCAN_INTERVAL_PRESENCE_FAST,
+    CONF_SCAN_INTERVAL_STATIC,
     CONF_SHOW_EERO_LOGO,
     CONF_SUFFIX_CONNECTION_TYPE,
     CONF_TIMEOUT,
@@ -53,9 +58,14 @@ from .const import (
     CONF_WIRELESS_CLIENTS_FILTER,
     DATA_API,
     DEFAULT_CONSIDER_HOME,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
     DEFAULT_PREFIX_NETWORK_NAME,
     DEFAULT_SAVE_RESPONSES,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL_ACTIVITY,
+    DEFAULT_SCAN_INTERVAL_PRESENCE,
+    DEFAULT_SCAN_INTERVAL_PRESENCE_FAST,
+    DEFAULT_SCAN_INTERVAL_STATIC,
     DEFAULT_SHOW_EERO_LOGO,
     DEFAULT_SUFFIX_CONNECTION_TYPE,
     DEFAULT_TIMEOUT,
@@ -63,13 +73,28 @@ from .const import (
     DEFAULT_WIRELESS_CLIENTS_FILTER,
     DOMAIN,
     MAX_CONSIDER_HOME,
+    MAX_MAX_CONCURRENT_REQUESTS,
     MAX_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL_ACTIVITY,
+    MAX_SCAN_INTERVAL_PRESENCE,
+    MAX_SCAN_INTERVAL_PRESENCE_FAST,
+    MAX_SCAN_INTERVAL_STATIC,
     MAX_TIMEOUT,
     MIN_CONSIDER_HOME,
+    MIN_MAX_CONCURRENT_REQUESTS,
     MIN_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL_ACTIVITY,
+    MIN_SCAN_INTERVAL_PRESENCE,
+    MIN_SCAN_INTERVAL_PRESENCE_FAST,
+    MIN_SCAN_INTERVAL_STATIC,
     MIN_TIMEOUT,
     STEP_CONSIDER_HOME,
+    STEP_MAX_CONCURRENT_REQUESTS,
     STEP_SCAN_INTERVAL,
+    STEP_SCAN_INTERVAL_ACTIVITY,
+    STEP_SCAN_INTERVAL_PRESENCE,
+    STEP_SCAN_INTERVAL_PRESENCE_FAST,
+    STEP_SCAN_INTERVAL_STATIC,
     STEP_TIMEOUT,
     VALUES_CLIENTS_FILTER,
 )
@@ -495,10 +520,11 @@ class EeroConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input:
             conf_scan_interval = user_input[CONF_SCAN_INTERVAL]
+            conf_scan_interval_presence = user_input[CONF_SCAN_INTERVAL_PRESENCE]
             conf_timeout = user_input[CONF_TIMEOUT]
 
             invalid_scan_interval_timeout = timedelta(
-                seconds=conf_scan_interval
+                seconds=min(conf_scan_interval, conf_scan_interval_presence)
             ) <= timedelta(seconds=conf_timeout)
 
             if invalid_scan_interval_timeout:
@@ -506,7 +532,22 @@ class EeroConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 self.user_input[CONF_SAVE_RESPONSES] = user_input[CONF_SAVE_RESPONSES]
                 self.user_input[CONF_SCAN_INTERVAL] = conf_scan_interval
+                self.user_input[CONF_SCAN_INTERVAL_PRESENCE] = (
+                    conf_scan_interval_presence
+                )
+                self.user_input[CONF_SCAN_INTERVAL_PRESENCE_FAST] = user_input[
+                    CONF_SCAN_INTERVAL_PRESENCE_FAST
+                ]
+                self.user_input[CONF_SCAN_INTERVAL_ACTIVITY] = user_input[
+                    CONF_SCAN_INTERVAL_ACTIVITY
+                ]
+                self.user_input[CONF_SCAN_INTERVAL_STATIC] = user_input[
+                    CONF_SCAN_INTERVAL_STATIC
+                ]
                 self.user_input[CONF_TIMEOUT] = conf_timeout
+                self.user_input[CONF_MAX_CONCURRENT_REQUESTS] = user_input[
+                    CONF_MAX_CONCURRENT_REQUESTS
+                ]
                 return self.async_create_entry(
                     title=self.config_title, data=self.user_input
                 )
@@ -528,6 +569,49 @@ class EeroConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             unit_of_measurement=UnitOfTime.SECONDS,
                         )
                     ),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_PRESENCE,
+                        default=DEFAULT_SCAN_INTERVAL_PRESENCE,
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=MIN_SCAN_INTERVAL_PRESENCE,
+                            max=MAX_SCAN_INTERVAL_PRESENCE,
+                            step=STEP_SCAN_INTERVAL_PRESENCE,
+                            unit_of_measurement=UnitOfTime.SECONDS,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_PRESENCE_FAST,
+                        default=DEFAULT_SCAN_INTERVAL_PRESENCE_FAST,
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=MIN_SCAN_INTERVAL_PRESENCE_FAST,
+                            max=MAX_SCAN_INTERVAL_PRESENCE_FAST,
+                            step=STEP_SCAN_INTERVAL_PRESENCE_FAST,
+                            unit_of_measurement=UnitOfTime.SECONDS,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_ACTIVITY,
+                        default=DEFAULT_SCAN_INTERVAL_ACTIVITY,
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=MIN_SCAN_INTERVAL_ACTIVITY,
+                            max=MAX_SCAN_INTERVAL_ACTIVITY,
+                            step=STEP_SCAN_INTERVAL_ACTIVITY,
+                            unit_of_measurement=UnitOfTime.SECONDS,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_STATIC, default=DEFAULT_SCAN_INTERVAL_STATIC
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=MIN_SCAN_INTERVAL_STATIC,
+                            max=MAX_SCAN_INTERVAL_STATIC,
+                            step=STEP_SCAN_INTERVAL_STATIC,
+                            unit_of_measurement=UnitOfTime.SECONDS,
+                        )
+                    ),
                     vol.Optional(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): NumberSelector(
                         NumberSelectorConfig(
                             min=MIN_TIMEOUT,
@@ -536,6 +620,16 @@ class EeroConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             unit_of_measurement=UnitOfTime.SECONDS,
                         )
                     ),
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT_REQUESTS,
+                        default=DEFAULT_MAX_CONCURRENT_REQUESTS,
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=MIN_MAX_CONCURRENT_REQUESTS,
+                            max=MAX_MAX_CONCURRENT_REQUESTS,
+                            step=STEP_MAX_CONCURRENT_REQUESTS,
+                        )
+                    ),
                 }
             ),
             errors=errors,
@@ -571,7 +665,7 @@ class EeroOptionsFlowHandler(config_entries.OptionsFlow):
     async def async_step_init(self, user_input=None):
         """Manage the options."""
         self.api = self.hass.data[DOMAIN][self.config_entry.entry_id][DATA_API]
-        self.response = await self.hass.async_add_executor_job(self.api.update)
+        self.response = await self.api.async_update()
         return await self.async_step_networks()
 
     async def async_step_networks(self, user_input=None):
@@ -976,10 +1070,11 @@ class EeroOptionsFlowHandler(config_entries.OptionsFlow):
 
         if user_input:
             conf_scan_interval = user_input[CONF_SCAN_INTERVAL]
+            conf_scan_interval_presence = user_input[CONF_SCAN_INTERVAL_PRESENCE]
             conf_timeout = user_input[CONF_TIMEOUT]
 
             invalid_scan_interval_timeout = timedelta(
-                seconds=conf_scan_interval
+                seconds=min(conf_scan_interval, conf_scan_interval_presence)
             ) <= timedelta(seconds=conf_timeout)
 
             if invalid_scan_interval_timeout:
@@ -987,7 +1082,22 @@ class EeroOptionsFlowHandler(config_entries.OptionsFlow):
             else:
                 self.user_input[CONF_SAVE_RESPONSES] = user_input[CONF_SAVE_RESPONSES]
                 self.user_input[CONF_SCAN_INTERVAL] = conf_scan_interval
+                self.user_input[CONF_SCAN_INTERVAL_PRESENCE] = (
+                    conf_scan_interval_presence
+                )
+                self.user_input[CONF_SCAN_INTERVAL_PRESENCE_FAST] = user_input[
+                    CONF_SCAN_INTERVAL_PRESENCE_FAST
+                ]
+                self.user_input[CONF_SCAN_INTERVAL_ACTIVITY] = user_input[
+                    CONF_SCAN_INTERVAL_ACTIVITY
+                ]
+                self.user_input[CONF_SCAN_INTERVAL_STATIC] = user_input[
+                    CONF_SCAN_INTERVAL_STATIC
+                ]
                 self.user_input[CONF_TIMEOUT] = conf_timeout
+                self.user_input[CONF_MAX_CONCURRENT_REQUESTS] = user_input[
+                    CONF_MAX_CONCURRENT_REQUESTS
+                ]
                 return self.async_create_entry(title="", data=self.user_input)
 
         conf_save_responses = self.options.get(
@@ -998,9 +1108,33 @@ class EeroOptionsFlowHandler(config_entries.OptionsFlow):
             CONF_SCAN_INTERVAL,
             self.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
         )
+        conf_scan_interval_presence = self.options.get(
+            CONF_SCAN_INTERVAL_PRESENCE,
+            self.data.get(CONF_SCAN_INTERVAL_PRESENCE, DEFAULT_SCAN_INTERVAL_PRESENCE),
+        )
+        conf_scan_interval_presence_fast = self.options.get(
+            CONF_SCAN_INTERVAL_PRESENCE_FAST,
+            self.data.get(
+                CONF_SCAN_INTERVAL_PRESENCE_FAST, DEFAULT_SCAN_INTERVAL_PRESENCE_FAST
+            ),
+        )
+        conf_scan_interval_activity = self.options.get(
+            CONF_SCAN_INTERVAL_ACTIVITY,
+            self.data.get(CONF_SCAN_INTERVAL_ACTIVITY, DEFAULT_SCAN_INTERVAL_ACTIVITY),
+        )
+        conf_scan_interval_static = self.options.get(
+            CONF_SCAN_INTERVAL_STATIC,
+            self.data.get(CONF_SCAN_INTERVAL_STATIC, DEFAULT_SCAN_INTERVAL_STATIC),
+        )
         conf_timeout = self.options.get(
             CONF_TIMEOUT, self.data.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
         )
+        conf_max_concurrent_requests = self.options.get(
+            CONF_MAX_CONCURRENT_REQUESTS,
+            self.data.get(
+                CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+            ),
+        )
 
         return self.async_show_form(
             step_id="advanced",
@@ -1019,6 +1153,47 @@ class EeroOptionsFlowHandler(config_entries.OptionsFlow):
                             unit_of_measurement=UnitOfTime.SECONDS,
                         )
                     ),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_PRESENCE, default=conf_scan_interval_presence
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=MIN_SCAN_INTERVAL_PRESENCE,
+                            max=MAX_SCAN_INTERVAL_PRESENCE,
+                            step=STEP_SCAN_INTERVAL_PRESENCE,
+                            unit_of_measurement=UnitOfTime.SECONDS,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_PRESENCE_FAST,
+                        default=conf_scan_interval_presence_fast,
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=MIN_SCAN_INTERVAL_PRESENCE_FAST,
+                            max=MAX_SCAN_INTERVAL_PRESENCE_FAST,
+                            step=STEP_SCAN_INTERVAL_PRESENCE_FAST,
+                            unit_of_measurement=UnitOfTime.SECONDS,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_ACTIVITY, default=conf_scan_interval_activity
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=MIN_SCAN_INTERVAL_ACTIVITY,
+                            max=MAX_SCAN_INTERVAL_ACTIVITY,
+                            step=STEP_SCAN_INTERVAL_ACTIVITY,
+                            unit_of_measurement=UnitOfTime.SECONDS,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_STATIC, default=conf_scan_interval_static
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=MIN_SCAN_INTERVAL_STATIC,
+                            max=MAX_SCAN_INTERVAL_STATIC,
+                            step=STEP_SCAN_INTERVAL_STATIC,
+                            unit_of_measurement=UnitOfTime.SECONDS,
+                        )
+                    ),
                     vol.Optional(CONF_TIMEOUT, default=conf_timeout): NumberSelector(
                         NumberSelectorConfig(
                             min=MIN_TIMEOUT,
@@ -1027,6 +1202,16 @@ class EeroOptionsFlowHandler(config_entries.OptionsFlow):
                             unit_of_measurement=UnitOfTime.SECONDS,
                         )
                     ),
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT_REQUESTS,
+                        default=conf_max_concurrent_requests,
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=MIN_MAX_CONCURRENT_REQUESTS,
+                            max=MAX_MAX_CONCURRENT_REQUESTS,
+                            step=STEP_MAX_CONCURRENT_REQUESTS,
+                        )
+                    ),
                 }
             ),
             errors=errors,
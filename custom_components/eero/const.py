@@ -70,12 +70,19 @@ CONF_WIRELESS_CLIENTS_FILTER = "wireless_clients_filter"
 
 DATA_API = "api"
 DATA_COORDINATOR = "coordinator"
+DATA_LAST_SEEN = "last_seen"
+DATA_STORAGE = "storage"
 DATA_UPDATE_LISTENER = "update_listener"
 
 DOMAIN = "eero"
 
 MANUFACTURER = "eero"
 
+STORAGE_SAVE_DELAY: int = 10
+STORAGE_SAVE_DELAY_LAST_SEEN: int = 10
+STORAGE_SAVE_DELAY_SNAPSHOT: int = 60
+STORAGE_VERSION: int = 1
+
 MODEL_BACKUP_NETWORK = "Backup Network"
 MODEL_CLIENT_WIRED = "Client (Wired)"
 MODEL_CLIENT_WIRELESS = "Client (Wireless)"
@@ -89,10 +96,15 @@ RELEASE_URL = (
 
 SERVICE_SET_BLOCKED_APPS = "set_blocked_apps"
 
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
 CONF_MISCELLANEOUS = "miscellaneous"
 CONF_PREFIX_NETWORK_NAME = "prefix_network_name"
 CONF_RESOURCES = "resources"
 CONF_SAVE_RESPONSES = "save_responses"
+CONF_SCAN_INTERVAL_ACTIVITY = "scan_interval_activity"
+CONF_SCAN_INTERVAL_PRESENCE = "scan_interval_presence"
+CONF_SCAN_INTERVAL_PRESENCE_FAST = "scan_interval_presence_fast"
+CONF_SCAN_INTERVAL_STATIC = "scan_interval_static"
 CONF_SHOW_EERO_LOGO = "show_eero_logo"
 CONF_SUFFIX_CONNECTION_TYPE = "suffix_connection_type"
 CONF_TIMEOUT = "timeout"
@@ -107,15 +119,40 @@ MIN_SCAN_INTERVAL: int = 30
 MAX_SCAN_INTERVAL: int = 600
 STEP_SCAN_INTERVAL: int = 30
 
+MIN_SCAN_INTERVAL_ACTIVITY: int = 60
+MAX_SCAN_INTERVAL_ACTIVITY: int = 3600
+STEP_SCAN_INTERVAL_ACTIVITY: int = 60
+
+MIN_SCAN_INTERVAL_PRESENCE: int = 15
+MAX_SCAN_INTERVAL_PRESENCE: int = 600
+STEP_SCAN_INTERVAL_PRESENCE: int = 15
+
+MIN_SCAN_INTERVAL_PRESENCE_FAST: int = 0
+MAX_SCAN_INTERVAL_PRESENCE_FAST: int = 60
+STEP_SCAN_INTERVAL_PRESENCE_FAST: int = 5
+
+MIN_SCAN_INTERVAL_STATIC: int = 300
+MAX_SCAN_INTERVAL_STATIC: int = 86400
+STEP_SCAN_INTERVAL_STATIC: int = 300
+
+MIN_MAX_CONCURRENT_REQUESTS: int = 1
+MAX_MAX_CONCURRENT_REQUESTS: int = 20
+STEP_MAX_CONCURRENT_REQUESTS: int = 1
+
 MIN_TIMEOUT: int = 10
 MAX_TIMEOUT: int = 60
 STEP_TIMEOUT: int = 5
 
 DEFAULT_CONSIDER_HOME: int = 0
+DEFAULT_MAX_CONCURRENT_REQUESTS: int = 5
 DEFAULT_PREFIX_NETWORK_NAME: bool = True
 DEFAULT_SAVE_LOCATION: str = f"/config/custom_components/{DOMAIN}/api/responses"
 DEFAULT_SAVE_RESPONSES: bool = False
 DEFAULT_SCAN_INTERVAL: int = 120
+DEFAULT_SCAN_INTERVAL_ACTIVITY: int = 600
+DEFAULT_SCAN_INTERVAL_PRESENCE: int = 120
+DEFAULT_SCAN_INTERVAL_PRESENCE_FAST: int = 0
+DEFAULT_SCAN_INTERVAL_STATIC: int = 3600
 DEFAULT_SHOW_EERO_LOGO: bool = False
 DEFAULT_SUFFIX_CONNECTION_TYPE: bool = True
 DEFAULT_TIMEOUT: int = 30
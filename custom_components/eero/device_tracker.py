@@ -16,9 +16,10 @@ from homeassistant.components.device_tracker import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_MANUFACTURER, STATE_HOME, STATE_NOT_HOME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
@@ -31,8 +32,11 @@ from .const import (
     CONF_PROFILES,
     CONF_RESOURCES,
     DATA_COORDINATOR,
+    DATA_LAST_SEEN,
+    DATA_STORAGE,
     DOMAIN as EERO_DOMAIN,
 )
+from .storage import EeroStorage
 from .util import client_allowed
 
 
@@ -79,6 +83,8 @@ async def async_setup_entry(
                                 profile.id,
                                 description,
                                 entry[CONF_MISCELLANEOUS][network.id],
+                                entry[DATA_LAST_SEEN],
+                                entry[DATA_STORAGE],
                             )
                         )
 
@@ -94,6 +100,8 @@ async def async_setup_entry(
                                 client.id,
                                 description,
                                 entry[CONF_MISCELLANEOUS][network.id],
+                                entry[DATA_LAST_SEEN],
+                                entry[DATA_STORAGE],
                             )
                         )
 
@@ -112,6 +120,8 @@ class EeroDeviceTrackerEntity(EeroEntity):
         resource_id: str,
         description: EeroDeviceTrackerEntityDescription,
         miscellaneous: dict[str, Any],
+        last_seen: dict[str, datetime],
+        storage: EeroStorage,
     ) -> None:
         """Initialize device."""
         super().__init__(
@@ -124,7 +134,68 @@ class EeroDeviceTrackerEntity(EeroEntity):
         self.consider_home: timedelta = timedelta(
             minutes=miscellaneous[CONF_CONSIDER_HOME]
         )
-        self.last_seen: datetime | None = None
+        self._last_seen = last_seen
+        self._storage = storage
+        self._unsub_consider_home: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        self._async_track_last_seen()
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_consider_home)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Track presence before the state is evaluated."""
+        self._async_track_last_seen()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_track_last_seen(self) -> None:
+        """Record when the resource was last seen connected.
+
+        Data restored from the stored snapshot is not fresh and leaves the
+        stored time alone. Once the resource disconnects, a timer writes the
+        away state exactly when the consider home interval expires instead of
+        on a later poll.
+        """
+        if not self.consider_home:
+            return
+        if self.resource.connected:
+            self._async_cancel_consider_home()
+            if not self.coordinator.data.restored:
+                self._last_seen[self.unique_id] = dt_util.utcnow()
+                self._storage.async_save_last_seen(self._last_seen)
+        elif all(
+            [
+                self._unsub_consider_home is None,
+                self.last_seen is not None,
+            ]
+        ):
+            expires = self.last_seen + self.consider_home
+            if expires > dt_util.utcnow():
+                self._unsub_consider_home = async_track_point_in_utc_time(
+                    self.hass, self._async_consider_home_expired, expires
+                )
+
+    @callback
+    def _async_consider_home_expired(self, now: datetime) -> None:
+        """Write the away state once the consider home interval expires."""
+        self._unsub_consider_home = None
+        self._fingerprint = self.fingerprint
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_consider_home(self) -> None:
+        """Cancel the consider home timer."""
+        if self._unsub_consider_home is not None:
+            self._unsub_consider_home()
+            self._unsub_consider_home = None
+
+    @property
+    def last_seen(self) -> datetime | None:
+        """Return when the device was last seen connected."""
+        return self._last_seen.get(self.unique_id)
 
     @property
     def name(self) -> str | None:
@@ -137,6 +208,14 @@ class EeroDeviceTrackerEntity(EeroEntity):
             return f"{self.network.name} {name}"
         return name
 
+    @property
+    def fingerprint(self) -> tuple | None:
+        """Return a fingerprint of the data the entity state is derived from."""
+        fingerprint = super().fingerprint
+        if fingerprint is None or not self.consider_home:
+            return fingerprint
+        return (*fingerprint, self.is_connected)
+
     @property
     def is_connected(self) -> bool | None:
         """Return true if the device is connected to the network."""
@@ -146,7 +225,6 @@ class EeroDeviceTrackerEntity(EeroEntity):
                     self.last_seen
                     and (dt_util.utcnow() - self.last_seen) < self.consider_home
                 )
-            self.last_seen = dt_util.utcnow()
             return True
         return self.resource.connected
 
@@ -0,0 +1,29 @@
+"""Diagnostics support for Eero."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_LOGIN, CONF_USER_TOKEN, DATA_API, DOMAIN
+
+TO_REDACT = {CONF_LOGIN, CONF_USER_TOKEN}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    api = hass.data[DOMAIN][config_entry.entry_id][DATA_API]
+    return {
+        "entry": {
+            "data": async_redact_data(config_entry.data, TO_REDACT),
+            "options": async_redact_data(config_entry.options, TO_REDACT),
+        },
+        "activity_timings": api.activity_timings,
+        "metrics": api.metrics.as_dict(),
+        "retained_bytes": api.retained_bytes,
+    }
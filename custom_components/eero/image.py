@@ -121,12 +121,18 @@ class EeroImageEntity(EeroEntity, ImageEntity):
             miscellaneous,
         )
         ImageEntity.__init__(self, hass)
-        self._current_image: bytes | None = None
+        self._current_key: tuple[str, str | None, str] | str | None = None
+
+    @property
+    def image_key(self) -> tuple[str, str | None, str] | str | None:
+        """Key identifying the current image."""
+        return getattr(self.resource, f"{self.entity_description.key}_key")
 
     @property
     def image_last_updated(self) -> datetime | None:
         """The time when the image was last updated."""
-        if self._current_image != getattr(self.resource, self.entity_description.key):
+        if self._current_key != (key := self.image_key):
+            self._current_key = key
             self._attr_image_last_updated = dt_util.utcnow()
         return self._attr_image_last_updated
 
@@ -134,10 +140,13 @@ class EeroImageEntity(EeroEntity, ImageEntity):
         """Fetch and set initial data and state."""
         await super().async_added_to_hass()
         await self.resource.api.generate_default_qr_code()
-        self._current_image = getattr(self.resource, self.entity_description.key)
+        self._current_key = self.image_key
         self._attr_image_last_updated = dt_util.utcnow()
 
+    async def async_image(self) -> bytes | None:
+        """Return bytes of image."""
+        return await self.resource.api.async_qr_code(self.image_key)
+
     def image(self) -> bytes | None:
         """Return bytes of image."""
-        self._current_image = getattr(self.resource, self.entity_description.key)
-        return self._current_image
+        return self.resource.api.qr_code(self.image_key)
@@ -116,7 +116,7 @@ class EeroLightEntity(EeroEntity, LightEntity):
         """Turn the entity on."""
         await super().async_turn_on(**kwargs)
         if self.entity_description.request_refresh:
-            await self.coordinator.async_request_refresh()
+            await self.async_request_network_refresh()
 
     def turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
@@ -126,4 +126,4 @@ class EeroLightEntity(EeroEntity, LightEntity):
         """Turn the entity off."""
         await super().async_turn_off(**kwargs)
         if self.entity_description.request_refresh:
-            await self.coordinator.async_request_refresh()
+            await self.async_request_network_refresh()
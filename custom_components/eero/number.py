@@ -91,4 +91,4 @@ class EeroNumberEntity(NumberEntity, EeroEntity):
         """Set new value."""
         await super().async_set_native_value(value)
         if self.entity_description.request_refresh:
-            await self.coordinator.async_request_refresh()
+            await self.async_request_network_refresh()
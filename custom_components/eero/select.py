@@ -114,4 +114,4 @@ class EeroSelectEntity(SelectEntity, EeroEntity):
         """Change the selected option."""
         await super().async_select_option(option)
         if self.entity_description.request_refresh:
-            await self.coordinator.async_request_refresh()
+            await self.async_request_network_refresh()
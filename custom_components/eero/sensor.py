@@ -18,6 +18,7 @@ from homeassistant.const import (
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
     UnitOfDataRate,
     UnitOfInformation,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
@@ -76,6 +77,7 @@ class EeroSensorEntityDescription(EeroEntityDescription, SensorEntityDescription
 
     native_value: Callable = lambda resource, key: getattr(resource, key)
     entity_category: str[EntityCategory] | None = EntityCategory.DIAGNOSTIC
+    account_wide: bool = False
     activity_type: bool = False
     wireless_only: bool = False
 
@@ -109,6 +111,38 @@ SENSOR_DESCRIPTIONS: list[EeroSensorEntityDescription] = [
         state_class=SensorStateClass.TOTAL_INCREASING,
         activity_type=True,
     ),
+    EeroSensorEntityDescription(
+        key="api_error_count",
+        name="API Errors",
+        native_unit_of_measurement="errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        extra_attrs={
+            "retries": lambda resource: resource.api.metrics.retry_count,
+            "session_refreshes": lambda resource: (
+                resource.api.metrics.session_refreshes
+            ),
+        },
+        account_wide=True,
+        skip_unchanged=False,
+    ),
+    EeroSensorEntityDescription(
+        key="api_request_count",
+        name="API Requests",
+        native_unit_of_measurement="requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        account_wide=True,
+        skip_unchanged=False,
+    ),
+    EeroSensorEntityDescription(
+        key="api_slowest_endpoint",
+        name="Slowest API Endpoint",
+        native_value=lambda resource, key: getattr(resource, key)[0],
+        extra_attrs={
+            "latency": lambda resource: resource.api_slowest_endpoint[1],
+        },
+        account_wide=True,
+        skip_unchanged=False,
+    ),
     EeroSensorEntityDescription(
         key="blocked_day",
         name="Threat Blocks Day",
@@ -184,6 +218,17 @@ SENSOR_DESCRIPTIONS: list[EeroSensorEntityDescription] = [
         native_unit_of_measurement=UnitOfInformation.BYTES,
         activity_type=True,
     ),
+    EeroSensorEntityDescription(
+        key="entity_writes_skipped",
+        name="Skipped State Writes",
+        native_unit_of_measurement="writes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        extra_attrs={
+            "written": lambda resource: resource.api.metrics.entity_writes,
+        },
+        account_wide=True,
+        skip_unchanged=False,
+    ),
     EeroSensorEntityDescription(
         key="gateway_ip",
         name="Gateway IP",
@@ -267,6 +312,20 @@ SENSOR_DESCRIPTIONS: list[EeroSensorEntityDescription] = [
         key="status",
         name="Status",
     ),
+    EeroSensorEntityDescription(
+        key="update_duration",
+        name="Update Duration",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=2,
+        extra_attrs={
+            "stages": lambda resource: resource.api.metrics.stage_durations(
+                resource.id
+            ),
+        },
+        skip_unchanged=False,
+    ),
     EeroSensorEntityDescription(
         key="usage_down",
         name="Download Rate",
@@ -305,12 +364,22 @@ async def async_setup_entry(
         description.key: description for description in SENSOR_DESCRIPTIONS
     }
 
+    account_network_id = next(
+        (
+            network_id
+            for network_id in entry[CONF_NETWORKS]
+            if coordinator.data.get_network(network_id)
+        ),
+        None,
+    )
+
     for network in coordinator.data.networks:
         if network.id in entry[CONF_NETWORKS]:
             activity = entry[CONF_ACTIVITY].get(network.id, {})
             for key, description in SUPPORTED_KEYS.items():
                 if any(
                     [
+                        description.account_wide and network.id != account_network_id,
                         description.premium_type and not network.premium_enabled,
                         description.activity_type
                         and key not in activity.get(CONF_ACTIVITY_NETWORK, []),
@@ -460,7 +529,7 @@ class EeroSensorEntity(EeroEntity, SensorEntity):
             )
         if self.entity_description.key.endswith("clients_count"):
             if self.resource.is_eero or self.resource.is_profile:
-                attrs["clients"] = sorted(self.resource.connected_clients_names)
+                attrs["clients"] = self.resource.connected_clients_names
             for category in DEVICE_CATEGORIES:
                 attr = f"{self.entity_description.key}_{category}"
                 if hasattr(self.resource, attr):
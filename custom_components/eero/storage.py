@@ -0,0 +1,104 @@
+"""The Eero integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api.account import EeroAccount
+from .api.cache import EeroReleaseNotesCache
+from .const import (
+    DOMAIN,
+    STORAGE_SAVE_DELAY,
+    STORAGE_SAVE_DELAY_LAST_SEEN,
+    STORAGE_SAVE_DELAY_SNAPSHOT,
+    STORAGE_VERSION,
+)
+
+
+class EeroStorage:
+    """Persistent storage for an Eero config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize."""
+        self.last_seen = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.last_seen")
+        self.release_notes = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.release_notes"
+        )
+        self.snapshot = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
+        self._pending: dict[str, Callable[[], Any]] = {}
+
+    @callback
+    def _async_delay_save(
+        self, store: Store, data_func: Callable[[], Any], delay: int
+    ) -> None:
+        """Schedule saving, without postponing a save that is already pending.
+
+        `Store.async_delay_save` restarts its timer on every call, so updates
+        more frequent than the delay would never be written. The latest data
+        function is used once the pending save runs instead.
+        """
+        pending = store.key in self._pending
+        self._pending[store.key] = data_func
+        if not pending:
+            store.async_delay_save(lambda: self._pending.pop(store.key)(), delay)
+
+    async def async_load_last_seen(self) -> dict[str, datetime]:
+        """Load when each tracked resource was last seen connected."""
+        return {
+            unique_id: last_seen
+            for unique_id, value in (await self.last_seen.async_load() or {}).items()
+            if (last_seen := dt_util.parse_datetime(value))
+        }
+
+    @callback
+    def async_save_last_seen(self, last_seen: dict[str, datetime]) -> None:
+        """Schedule saving when each tracked resource was last seen connected."""
+        self._async_delay_save(
+            self.last_seen,
+            lambda: {
+                unique_id: value.isoformat() for unique_id, value in last_seen.items()
+            },
+            STORAGE_SAVE_DELAY_LAST_SEEN,
+        )
+
+    async def async_load_release_notes(self) -> EeroReleaseNotesCache:
+        """Load the release notes cache."""
+        return EeroReleaseNotesCache(data=await self.release_notes.async_load())
+
+    @callback
+    def async_save_release_notes(self, cache: EeroReleaseNotesCache) -> None:
+        """Schedule saving the release notes cache if it changed."""
+        if cache.dirty:
+            self._async_delay_save(
+                self.release_notes, cache.as_dict, STORAGE_SAVE_DELAY
+            )
+
+    async def async_load_snapshot(
+        self, config: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Load the last account snapshot saved with the same configuration."""
+        if snapshot := await self.snapshot.async_load():
+            if snapshot.get("config") == config:
+                return snapshot.get("data")
+        return None
+
+    @callback
+    def async_save_snapshot(self, config: dict[str, Any], account: EeroAccount) -> None:
+        """Schedule saving an account snapshot."""
+        self._async_delay_save(
+            self.snapshot,
+            lambda: {"config": config, "data": account.data},
+            STORAGE_SAVE_DELAY_SNAPSHOT,
+        )
+
+    async def async_remove(self) -> None:
+        """Remove all stored data."""
+        await self.last_seen.async_remove()
+        await self.release_notes.async_remove()
+        await self.snapshot.async_remove()
@@ -294,7 +294,7 @@ class EeroSwitchEntity(EeroEntity, SwitchEntity):
         """Turn the entity on."""
         await super().async_turn_on()
         if self.entity_description.request_refresh:
-            await self.coordinator.async_request_refresh()
+            await self.async_request_network_refresh()
 
     def turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
@@ -304,4 +304,4 @@ class EeroSwitchEntity(EeroEntity, SwitchEntity):
         """Turn the entity off."""
         await super().async_turn_off()
         if self.entity_description.request_refresh:
-            await self.coordinator.async_request_refresh()
+            await self.async_request_network_refresh()
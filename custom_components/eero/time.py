@@ -92,4 +92,4 @@ class EeroTimeEntity(TimeEntity, EeroEntity):
         """Change the time."""
         await super().async_set_value(value)
         if self.entity_description.request_refresh:
-            await self.coordinator.async_request_refresh()
+            await self.async_request_network_refresh()
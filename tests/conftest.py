@@ -0,0 +1,18 @@
+"""Fixtures for the Eero API tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "benchmarks"))
+
+from common import load_api  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def api_module():
+    """Eero API package, loaded without Home Assistant."""
+    return load_api()
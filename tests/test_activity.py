@@ -0,0 +1,58 @@
+"""Tests for deriving activity series."""
+
+from __future__ import annotations
+
+START = "2024-05-06T00:00:00+00:00"
+END = "2024-05-12T23:59:59+00:00"
+
+
+def series(*values: int) -> list[dict]:
+    """Daily values from the start of May."""
+    return [
+        {"time": f"2024-05-{day:02d}T00:00:00Z", "value": value}
+        for day, value in enumerate(values, start=1)
+    ]
+
+
+def test_derive_week_from_month(api_module) -> None:
+    """A week is sliced out of a month series with matching sum."""
+    values = series(*range(1, 16))
+    data = [{"type": "download", "sum": sum(range(1, 16)), "values": values}]
+    derived = api_module.activity.derive_activity(data, START, END)
+    assert derived == [
+        {"type": "download", "sum": sum(range(6, 13)), "values": values[5:12]}
+    ]
+
+
+def test_derive_sum_only_entry(api_module) -> None:
+    """A per-device entry carrying only its sum can not be derived."""
+    data = [
+        {"insights_url": "/2.2/networks/1/insights/devices/1", "sum": 42, "values": []}
+    ]
+    assert api_module.activity.derive_activity(data, START, END) is None
+
+
+def test_derive_unreproducible_sum(api_module) -> None:
+    """A series whose values do not add up to its sum can not be derived."""
+    data = [{"type": "download", "sum": 1000, "values": series(1, 2, 3)}]
+    assert api_module.activity.derive_activity(data, START, END) is None
+
+
+def test_derivable_requests(api_module) -> None:
+    """Only series with values are derived, sum-only payloads are fetched."""
+    const = api_module.const
+
+    def request(activity: str, resource: str) -> bool:
+        return api_module.activity.EeroActivityRequest(
+            activity=activity,
+            network_url="/2.2/networks/1",
+            profile_id="1" if resource == "profiles" else None,
+            resource=resource,
+            timezone="UTC",
+        ).derivable
+
+    assert request(const.ACTIVITY_DATA_USAGE_WEEK, "network")
+    assert request(const.ACTIVITY_BLOCKED_WEEK, "profiles")
+    assert not request(const.ACTIVITY_BLOCKED_WEEK, "network")
+    assert not request(const.ACTIVITY_DATA_USAGE_WEEK, "devices")
+    assert not request(const.ACTIVITY_DATA_USAGE_WEEK, "eeros")